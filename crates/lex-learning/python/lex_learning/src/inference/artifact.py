@@ -10,13 +10,18 @@ from typing import TYPE_CHECKING, Any
 
 from ..config import ProblemType
 from ..core import ExplainabilityResult, Metrics
-from ..errors import ModelNotFoundError
+from ..errors import InferenceError, ModelNotFoundError
 
 if TYPE_CHECKING:
     from ..preprocessing import Preprocessor
 
-# Current artifact version
-ARTIFACT_VERSION = "1.0"
+# Current artifact version. 1.1 stores array buffers out-of-band after a header;
+# 1.0 artifacts are a single plain pickle and are still loadable.
+ARTIFACT_VERSION = "1.1"
+
+# Leading header of artifacts whose array payloads are stored out-of-band.
+# Files that start with a pickled ModelArtifact instead are the legacy format.
+_OOB_HEADER_TAG = "lex-artifact-oob"
 
 
 @dataclass
@@ -96,6 +101,12 @@ def create_artifact(
 def save_artifact(artifact: ModelArtifact, path: str | Path) -> None:
     """Save a model artifact to disk.
 
+    The artifact is pickled with protocol 5 and its contiguous array buffers
+    are written out-of-band after the pickle stream, so large model arrays
+    are copied straight from memory to disk. The file layout is a small
+    pickled header (tag, pickle length, buffer lengths), the pickle stream,
+    then the raw buffers in order.
+
     Args:
         artifact: The model artifact to save.
         path: Path to save the artifact (typically .pkl extension).
@@ -103,8 +114,16 @@ def save_artifact(artifact: ModelArtifact, path: str | Path) -> None:
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    buffers: list[pickle.PickleBuffer] = []
+    payload = pickle.dumps(artifact, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+
     with open(path, "wb") as f:
-        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        header = (_OOB_HEADER_TAG, len(payload), [raw.nbytes for raw in raw_buffers])
+        pickle.dump(header, f, protocol=5)
+        f.write(payload)
+        for raw in raw_buffers:
+            f.write(raw)
 
 
 def load_artifact(path: str | Path) -> ModelArtifact:
@@ -118,6 +137,7 @@ def load_artifact(path: str | Path) -> ModelArtifact:
 
     Raises:
         ModelNotFoundError: If the file does not exist.
+        InferenceError: If the file is not a model artifact or is truncated.
     """
     path = Path(path)
 
@@ -125,7 +145,30 @@ def load_artifact(path: str | Path) -> ModelArtifact:
         raise ModelNotFoundError(str(path))
 
     with open(path, "rb") as f:
-        artifact = pickle.load(f)
+        try:
+            header = pickle.load(f)
+        except (EOFError, pickle.UnpicklingError) as e:
+            raise InferenceError(f"Model artifact is truncated: {path}") from e
+        if isinstance(header, ModelArtifact):
+            # Legacy single-pickle artifact
+            return header
+
+        if not (isinstance(header, tuple) and len(header) == 3 and header[0] == _OOB_HEADER_TAG):
+            raise InferenceError(f"Unrecognized model artifact format: {path}")
+
+        _, payload_size, buffer_sizes = header
+        payload = f.read(payload_size)
+        if len(payload) != payload_size:
+            raise InferenceError(f"Model artifact is truncated: {path}")
+
+        buffers = []
+        for size in buffer_sizes:
+            buffer = bytearray(size)
+            if f.readinto(buffer) != size:
+                raise InferenceError(f"Model artifact is truncated: {path}")
+            buffers.append(buffer)
+
+    artifact = pickle.loads(payload, buffers=buffers)
 
     # Version validation could be added here in the future
     # For now, we trust the artifact format
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,12 @@ from .artifact import (
     save_artifact,
 )
 
+# Readers for batch input files by suffix; anything else is parsed as CSV
+_BATCH_READERS: dict[str, Callable[[Path], pd.DataFrame]] = {
+    ".feather": pd.read_feather,
+    ".parquet": pd.read_parquet,
+}
+
 
 class TrainedModel:
     """Trained model for inference.
@@ -67,6 +75,11 @@ class TrainedModel:
         """Get class labels for classification problems."""
         return self._artifact.class_labels.copy() if self._artifact.class_labels else None
 
+    @cached_property
+    def class_labels_set(self) -> frozenset[str] | None:
+        """Get class labels as a frozenset for membership checks (cached)."""
+        return frozenset(self._artifact.class_labels) if self._artifact.class_labels else None
+
     @property
     def metrics(self) -> Metrics:
         """Get training metrics."""
@@ -107,6 +120,7 @@ class TrainedModel:
 
         Raises:
             ModelNotFoundError: If the file does not exist.
+            InferenceError: If the file is not a model artifact or is truncated.
         """
         artifact = load_artifact(path)
         return cls(artifact)
@@ -130,14 +144,10 @@ class TrainedModel:
             InferenceError: If prediction fails.
         """
         try:
-            # Convert to DataFrame
-            df = pd.DataFrame([instance])
+            self._check_features(instance.keys())
 
-            # Ensure columns are in the right order
-            df = self._prepare_dataframe(df)
-
-            # Transform features
-            X, _ = self._artifact.preprocessor.transform(df)
+            # Transform features straight from the dict (no DataFrame round-trip)
+            X = self._artifact.preprocessor.transform_instance(instance)
 
             # Make prediction
             pred = self._artifact.model.predict(X)[0]
@@ -179,7 +189,7 @@ class TrainedModel:
         """Make predictions for multiple instances.
 
         Args:
-            data: DataFrame or path to CSV file.
+            data: DataFrame or path to a CSV, Feather (.feather) or Parquet (.parquet) file.
 
         Returns:
             DataFrame with original data plus "prediction" column.
@@ -189,7 +199,11 @@ class TrainedModel:
         """
         try:
             # Load data if path
-            df = pd.read_csv(data) if isinstance(data, (str, Path)) else data.copy()
+            if isinstance(data, (str, Path)):
+                path = Path(data)
+                df = _BATCH_READERS.get(path.suffix.lower(), pd.read_csv)(path)
+            else:
+                df = data.copy()
 
             # Prepare DataFrame
             df_features = self._prepare_dataframe(df)
@@ -217,15 +231,18 @@ class TrainedModel:
 
         Ensures columns are in the right order and handles missing features.
         """
-        # Check for missing features
-        missing = set(self._artifact.feature_names) - set(df.columns)
-        if missing:
-            raise InferenceError(f"Missing features: {missing}")
+        self._check_features(df.columns)
 
         # Select and order columns - cast to satisfy type checker
         result: pd.DataFrame = df[self._artifact.feature_names]  # type: ignore[assignment]
         return result
 
+    def _check_features(self, columns: Iterable[Any]) -> None:
+        """Raise InferenceError if any trained feature is absent from columns."""
+        missing = set(self._artifact.feature_names).difference(columns)
+        if missing:
+            raise InferenceError(f"Missing features: {missing}")
+
     @classmethod
     def from_training_result(
         cls,
@@ -36,6 +36,7 @@ from .stages import (
     PreprocessingStage,
     SplitStage,
     ValidationStage,
+    validate_data,
 )
 
 if TYPE_CHECKING:
@@ -96,6 +97,20 @@ class Pipeline:
         """Create a builder for Pipeline."""
         return PipelineBuilder()
 
+    def validate(self, data: pd.DataFrame | None) -> None:
+        """Check data against the configuration without training.
+
+        Runs the same checks as the validation stage of train().
+
+        Args:
+            data: DataFrame with features and target column.
+
+        Raises:
+            InvalidDataError: If data validation fails.
+            TargetNotFoundError: If target column not found.
+        """
+        validate_data(data, self._config.target_column)
+
     def train(self, data: pd.DataFrame) -> TrainingResult:
         """Train models on the provided data.
 
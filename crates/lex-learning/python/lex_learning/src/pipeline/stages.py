@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import Any
 
 import numpy as np
+import pandas as pd
 from sklearn.metrics import (
     accuracy_score,
     confusion_matrix,
@@ -37,6 +38,45 @@ from ..progress import ProgressUpdate, TrainingStage
 from ..training import DatasetInfo, select_algorithms, train_models
 
 
+def validate_data(data: pd.DataFrame | None, target_column: str | None) -> str:
+    """Check that data is usable for training.
+
+    Args:
+        data: DataFrame with features and target column.
+        target_column: Configured target column, or None to use the last column.
+
+    Returns:
+        The resolved target column name.
+
+    Raises:
+        TargetNotFoundError: If the target column is not in the data.
+        InvalidDataError: If no data is given, or it has null values or fewer than 10 samples.
+    """
+    if data is None:
+        raise InvalidDataError("No data provided to pipeline")
+
+    # Determine target column
+    if target_column is None:
+        target_column = str(data.columns[-1])
+
+    # Check target exists
+    if target_column not in data.columns:
+        raise TargetNotFoundError(target_column, list(data.columns))
+
+    # Check for nulls
+    null_columns = data.isnull().any()
+    if null_columns.any():
+        raise InvalidDataError(
+            f"Data contains null values in columns: {data.columns[null_columns].tolist()}"
+        )
+
+    # Check minimum samples
+    if len(data) < 10:
+        raise InvalidDataError(f"Data must have at least 10 samples, got {len(data)}")
+
+    return target_column
+
+
 class ValidationStage:
     """Validates input data and prepares features/target split.
 
@@ -58,28 +98,8 @@ class ValidationStage:
             )
         )
 
-        if context.data is None:
-            raise InvalidDataError("No data provided to pipeline")
-
         data = context.data
-
-        # Determine target column
-        target_column = context.config.target_column
-        if target_column is None:
-            target_column = str(data.columns[-1])
-
-        # Check target exists
-        if target_column not in data.columns:
-            raise TargetNotFoundError(target_column, list(data.columns))
-
-        # Check for nulls
-        if data.isnull().any().any():
-            null_cols = data.columns[data.isnull().any()].tolist()
-            raise InvalidDataError(f"Data contains null values in columns: {null_cols}")
-
-        # Check minimum samples
-        if len(data) < 10:
-            raise InvalidDataError(f"Data must have at least 10 samples, got {len(data)}")
+        target_column = validate_data(data, context.config.target_column)
 
         # Split features and target
         context.X = data.drop(columns=[target_column])
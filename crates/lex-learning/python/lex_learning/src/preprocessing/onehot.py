@@ -0,0 +1,67 @@
+"""Compact one-hot representation for categorical feature blocks.
+
+Internal to the preprocessor: a one-hot matrix only ever stores the value 1.0,
+so the block keeps one int32 code per cell and the offset of each source
+column in the expanded column space, and expands to dense on demand.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class OneHotBlock:
+    """One-hot encoded categorical block stored as integer category codes.
+
+    Row ``i`` has a 1.0 at expanded column ``offsets[j] + codes[i, j]`` for every
+    source column ``j``. A code of -1 marks an unknown category and encodes to
+    an all-zero group, matching ``OneHotEncoder(handle_unknown="ignore")``.
+    """
+
+    def __init__(self, codes: NDArray[np.int32], cardinalities: list[int]) -> None:
+        """Initialize from category codes.
+
+        Args:
+            codes: Array of shape (n_rows, n_columns) with category codes (-1 = unknown).
+            cardinalities: Number of categories for each source column.
+        """
+        if codes.ndim != 2 or codes.shape[1] != len(cardinalities):
+            raise ValueError("codes must be 2-D with one column per cardinality")
+
+        self.codes = np.ascontiguousarray(codes, dtype=np.int32)
+        self.cardinalities = list(cardinalities)
+        self.offsets = np.zeros(len(self.cardinalities), dtype=np.int32)
+        self.offsets[1:] = np.cumsum(self.cardinalities[:-1])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the expanded one-hot matrix."""
+        return self.codes.shape[0], int(sum(self.cardinalities))
+
+    def _columns(self) -> NDArray[np.int32]:
+        """Expanded column index of every cell (only valid where the code is known)."""
+        return self.codes + self.offsets
+
+    def to_dense(self, out: NDArray[np.float64] | None = None) -> NDArray[np.float64]:
+        """Expand to a dense float64 one-hot matrix.
+
+        Args:
+            out: Optional array of the expanded shape to fill in place, such as a
+                column slice of a wider feature matrix.
+
+        Returns:
+            The dense one-hot matrix (``out`` when given).
+        """
+        n_rows, n_cols = self.shape
+        if out is None:
+            out = np.empty((n_rows, n_cols), dtype=np.float64)
+        out.fill(0.0)
+
+        rows = np.broadcast_to(np.arange(n_rows)[:, np.newaxis], self.codes.shape)
+        known = self.codes >= 0
+        if known.all():
+            out[rows, self._columns()] = 1.0
+        else:
+            out[rows[known], self._columns()[known]] = 1.0
+        return out
@@ -5,29 +5,83 @@ Handles encoding of categorical features and scaling of numeric features.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, cast
 
 import numpy as np
 import pandas as pd
 from numpy.typing import NDArray
-from scipy import sparse
-from sklearn.compose import ColumnTransformer
-from sklearn.pipeline import Pipeline as SklearnPipeline
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler
+from sklearn.preprocessing import LabelEncoder, StandardScaler
 
 from ..config import ProblemType
+from .onehot import OneHotBlock
+
+
+def _missing_is_none(
+    column: pd.Series | NDArray[Any], missing: NDArray[np.bool_]
+) -> NDArray[np.bool_]:
+    """Whether each missing value of a column is None rather than NaN-like."""
+    return np.array([value is None for value in column[missing]], dtype=bool)
+
+
+def _learn_categories(column: pd.Series | NDArray[Any]) -> pd.Index:
+    """Learn the categories of one column the way OneHotEncoder does.
+
+    Non-missing values are sorted; None and NaN are each kept as their own
+    trailing category (None first) rather than being compared with them.
+    """
+    codes, uniques = pd.factorize(column)
+    categories: list[Any] = list(np.unique(np.asarray(uniques, dtype=object)))
+    missing = codes < 0
+    if missing.any():
+        is_none = _missing_is_none(column, missing)
+        if is_none.any():
+            categories.append(None)
+        if not is_none.all():
+            categories.append(np.nan)
+    return pd.Index(categories, dtype=object)
+
+
+def _category_codes(categories: pd.Index, column: pd.Series | NDArray[Any]) -> NDArray[np.intp]:
+    """Look up the category code of every value in one column (-1 = unknown).
+
+    The column is factorized first, so categories are looked up once per
+    distinct value (as OneHotEncoder's dict-based encoding does for objects)
+    and broadcast back to the rows through the factorized codes.
+    """
+    codes, uniques = pd.factorize(column)
+    code_of = {category: i for i, category in enumerate(categories) if not pd.isna(category)}
+    lookup = np.fromiter(
+        (code_of.get(value, -1) for value in uniques), dtype=np.intp, count=len(uniques)
+    )
+    # Factorize marks missing values with -1, which picks the trailing -1 here
+    result = np.append(lookup, -1)[codes]
+
+    # Map missing values explicitly: factorize conflates None with NaN
+    missing_categories = np.flatnonzero(pd.isna(categories))
+    missing = codes < 0
+    if missing_categories.size and missing.any():
+        missing_rows = np.flatnonzero(missing)
+        is_none = _missing_is_none(column, missing)
+        for position in missing_categories:
+            result[missing_rows[is_none == (categories[position] is None)]] = position
+    return result
 
 
 class Preprocessor:
     """Preprocesses data for ML training.
 
     Handles:
-    - Encoding categorical features (OneHotEncoder)
+    - Encoding categorical features (one-hot via OneHotBlock)
     - Scaling numeric features (StandardScaler)
     - Encoding target variable for classification (LabelEncoder)
 
     The preprocessor must be fit on training data before transforming.
     It is saved with the model for consistent inference.
+
+    Column positions are resolved once during fit, so transform extracts the
+    numeric and categorical blocks directly instead of going through a
+    ColumnTransformer's per-column DataFrame selection.
     """
 
     def __init__(self, problem_type: ProblemType) -> None:
@@ -37,14 +91,34 @@ class Preprocessor:
             problem_type: Type of ML problem (classification or regression).
         """
         self.problem_type = problem_type
-        self._feature_transformer: ColumnTransformer | None = None
+        self._scaler: StandardScaler | None = None
+        self._categories: list[pd.Index] = []
         self._target_encoder: LabelEncoder | None = None
         self._feature_names: list[str] = []
         self._numeric_features: list[str] = []
         self._categorical_features: list[str] = []
+        self._numeric_idx: NDArray[np.intp] = np.empty(0, dtype=np.intp)
+        self._categorical_idx: NDArray[np.intp] = np.empty(0, dtype=np.intp)
         self._class_labels: list[str] | None = None
         self._is_fitted = False
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled preprocessor, migrating the legacy ColumnTransformer layout.
+
+        Preprocessors pickled before the positional-block transform hold a fitted
+        ``_feature_transformer`` instead of the scaler, categories and column
+        positions; those are rebuilt from it so older model artifacts still predict.
+
+        Args:
+            state: Pickled instance ``__dict__``.
+        """
+        legacy_transformer = state.pop("_feature_transformer", None)
+        # Start from the current defaults so attributes added since the pickle exist
+        self.__init__(state["problem_type"])  # type: ignore[misc]
+        self.__dict__.update(state)
+        if legacy_transformer is not None:
+            self._migrate_column_transformer(legacy_transformer)
+
     @property
     def is_fitted(self) -> bool:
         """Whether the preprocessor has been fitted."""
@@ -63,13 +137,13 @@ class Preprocessor:
     @property
     def transformed_feature_names(self) -> list[str]:
         """Feature names after transformation (includes one-hot encoded names)."""
-        if not self._is_fitted or self._feature_transformer is None:
+        if not self._is_fitted:
             return []
-        try:
-            return list(self._feature_transformer.get_feature_names_out())
-        except Exception:
-            # Fallback if get_feature_names_out fails
-            return self._feature_names.copy()
+
+        names = [f"numeric__{name}" for name in self._numeric_features]
+        for feature, categories in zip(self._categorical_features, self._categories, strict=True):
+            names.extend(f"categorical__{feature}_{category}" for category in categories)
+        return names
 
     def fit(
         self,
@@ -87,10 +161,16 @@ class Preprocessor:
         """
         self._feature_names = [str(c) for c in X.columns]
         self._identify_column_types(X)
-        self._build_feature_transformer()
 
-        if self._feature_transformer is not None:
-            self._feature_transformer.fit(X)
+        self._scaler = None
+        self._categories = []
+
+        if self._numeric_features:
+            self._scaler = StandardScaler()
+            self._scaler.fit(self._numeric_block(X))
+
+        if self._categorical_features:
+            self._categories = [_learn_categories(c) for c in self._categorical_columns(X)]
 
         # Fit target encoder for classification
         if self.problem_type == ProblemType.CLASSIFICATION:
@@ -121,15 +201,16 @@ class Preprocessor:
         Raises:
             ValueError: If preprocessor is not fitted.
         """
-        if not self._is_fitted or self._feature_transformer is None:
+        if not self._is_fitted:
             raise ValueError("Preprocessor must be fitted before transform")
 
-        X_result = self._feature_transformer.transform(X)
-        # Ensure we have a dense numpy array
-        if sparse.issparse(X_result):
-            X_transformed: NDArray[Any] = X_result.toarray()  # type: ignore[union-attr]
-        else:
-            X_transformed = np.asarray(X_result)
+        # Reorder to the fitted layout so the cached column positions apply
+        if [str(c) for c in X.columns] != self._feature_names:
+            X = cast(pd.DataFrame, X[self._feature_names])
+
+        X_transformed = self._combine_blocks(
+            self._numeric_block(X), self._categorical_columns(X), n_rows=len(X)
+        )
 
         y_transformed: NDArray[Any] | None = None
         if y is not None:
@@ -140,6 +221,36 @@ class Preprocessor:
 
         return X_transformed, y_transformed
 
+    def transform_instance(self, instance: Mapping[str, Any]) -> NDArray[Any]:
+        """Transform a single instance without building a DataFrame.
+
+        Args:
+            instance: Mapping from original feature name to value.
+
+        Returns:
+            Array of shape (1, n_transformed_features).
+
+        Raises:
+            ValueError: If preprocessor is not fitted.
+            KeyError: If a fitted feature is missing from the instance.
+        """
+        if not self._is_fitted:
+            raise ValueError("Preprocessor must be fitted before transform")
+
+        numeric = np.fromiter(
+            (
+                np.nan if instance[name] is None else instance[name]
+                for name in self._numeric_features
+            ),
+            dtype=np.float64,
+            count=len(self._numeric_features),
+        ).reshape(1, -1)
+        categorical = np.empty((len(self._categorical_features), 1), dtype=object)
+        for j, name in enumerate(self._categorical_features):
+            categorical[j, 0] = instance[name]
+
+        return self._combine_blocks(numeric, list(categorical), n_rows=1)
+
     def fit_transform(
         self,
         X: pd.DataFrame,
@@ -172,38 +283,75 @@ class Preprocessor:
             return cast(NDArray[Any], self._target_encoder.inverse_transform(y.astype(int)))
         return y
 
+    def _migrate_column_transformer(self, transformer: Any) -> None:
+        """Take the scaler, categories and column positions from a fitted ColumnTransformer."""
+        fitted = transformer.named_transformers_
+        if self._numeric_features:
+            self._scaler = fitted["numeric"].named_steps["scaler"]
+            # It was fitted on a DataFrame selection but now receives a positional block
+            if hasattr(self._scaler, "feature_names_in_"):
+                del self._scaler.feature_names_in_
+        if self._categorical_features:
+            encoder = fitted["categorical"].named_steps["encoder"]
+            self._categories = [
+                pd.Index(list(categories), dtype=object) for categories in encoder.categories_
+            ]
+
+        position = {name: i for i, name in enumerate(self._feature_names)}
+        self._numeric_idx = np.array(
+            [position[name] for name in self._numeric_features], dtype=np.intp
+        )
+        self._categorical_idx = np.array(
+            [position[name] for name in self._categorical_features], dtype=np.intp
+        )
+
+    def _one_hot(self, columns: list[Any], n_rows: int) -> OneHotBlock:
+        """Look up category codes for the categorical columns in the fitted layout."""
+        codes = np.empty((n_rows, len(self._categories)), dtype=np.int32)
+        for j, (categories, column) in enumerate(zip(self._categories, columns, strict=True)):
+            codes[:, j] = _category_codes(categories, column)
+        return OneHotBlock(codes, [len(categories) for categories in self._categories])
+
+    def _combine_blocks(
+        self, numeric: NDArray[np.float64], categorical: list[Any], n_rows: int
+    ) -> NDArray[Any]:
+        """Scale the numeric block and one-hot the categorical columns into one matrix."""
+        if not self._categories:
+            if self._scaler is not None:
+                return self._scaler.transform(numeric)
+            return np.empty((n_rows, 0))
+
+        # Fill one preallocated matrix instead of stacking separately built blocks
+        block = self._one_hot(categorical, n_rows)
+        n_numeric = numeric.shape[1] if self._scaler is not None else 0
+        X_transformed = np.empty((n_rows, n_numeric + block.shape[1]))
+        if self._scaler is not None:
+            X_transformed[:, :n_numeric] = self._scaler.transform(numeric)
+        block.to_dense(out=X_transformed[:, n_numeric:])
+        return X_transformed
+
     def _identify_column_types(self, X: pd.DataFrame) -> None:
-        """Identify numeric and categorical columns."""
+        """Identify numeric and categorical columns and their positions."""
         self._numeric_features = []
         self._categorical_features = []
+        numeric_idx: list[int] = []
+        categorical_idx: list[int] = []
 
-        for col in X.columns:
+        for i, col in enumerate(X.columns):
             if pd.api.types.is_numeric_dtype(X[col]):
                 self._numeric_features.append(str(col))
+                numeric_idx.append(i)
             else:
                 self._categorical_features.append(str(col))
+                categorical_idx.append(i)
 
-    def _build_feature_transformer(self) -> None:
-        """Build the sklearn ColumnTransformer."""
-        transformers: list[tuple[str, SklearnPipeline, list[str]]] = []
+        self._numeric_idx = np.asarray(numeric_idx, dtype=np.intp)
+        self._categorical_idx = np.asarray(categorical_idx, dtype=np.intp)
 
-        if self._numeric_features:
-            numeric_pipeline = SklearnPipeline(
-                [
-                    ("scaler", StandardScaler()),
-                ]
-            )
-            transformers.append(("numeric", numeric_pipeline, self._numeric_features))
+    def _numeric_block(self, X: pd.DataFrame) -> NDArray[np.float64]:
+        """Extract numeric columns as a single float64 array."""
+        return X.iloc[:, self._numeric_idx].to_numpy(dtype=np.float64)
 
-        if self._categorical_features:
-            categorical_pipeline = SklearnPipeline(
-                [
-                    ("encoder", OneHotEncoder(handle_unknown="ignore", sparse_output=False)),
-                ]
-            )
-            transformers.append(("categorical", categorical_pipeline, self._categorical_features))
-
-        self._feature_transformer = ColumnTransformer(
-            transformers=transformers,
-            remainder="drop",  # Drop any columns not in our lists
-        )
+    def _categorical_columns(self, X: pd.DataFrame) -> list[pd.Series]:
+        """Extract categorical columns as Series, keeping their own dtypes."""
+        return [X.iloc[:, i] for i in self._categorical_idx]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import warnings
 from typing import Any
 
+import joblib
 import numpy as np
 import optuna
 from numpy.typing import NDArray
@@ -18,6 +20,34 @@ from ..progress import ProgressReporter
 # Suppress Optuna logging
 optuna.logging.set_verbosity(optuna.logging.WARNING)
 
+# Algorithms whose estimators parallelise internally (per tree / boosting round).
+# These keep n_jobs on the model and run CV folds serially; all other algorithms
+# are single-threaded per model and parallelise across CV folds instead.
+MODEL_PARALLEL_ALGORITHMS = frozenset(
+    {
+        "random_forest",
+        "extra_trees",
+        "xgboost",
+        "lightgbm",
+        "neural_network",
+    }
+)
+
+
+def split_n_jobs(algorithm: str, n_jobs: int) -> tuple[int, int]:
+    """Split the worker budget between the model and the CV folds.
+
+    Args:
+        algorithm: Algorithm name.
+        n_jobs: Configured number of parallel jobs.
+
+    Returns:
+        Tuple of (model_n_jobs, cv_n_jobs).
+    """
+    if algorithm in MODEL_PARALLEL_ALGORITHMS:
+        return n_jobs, 1
+    return 1, n_jobs
+
 
 def optimize_hyperparameters(
     X_train: NDArray[Any],
@@ -51,6 +81,9 @@ def optimize_hyperparameters(
 
     best_params: dict[str, Any] = {}
 
+    # Split parallelism between the model and the CV folds to avoid oversubscription
+    model_n_jobs, cv_n_jobs = split_n_jobs(algorithm, config.n_jobs)
+
     def objective(trial: optuna.Trial) -> float:
         nonlocal best_params
 
@@ -62,11 +95,17 @@ def optimize_hyperparameters(
             config.problem_type,
             trial=trial,
             random_seed=config.random_seed,
-            n_jobs=config.n_jobs,
+            n_jobs=model_n_jobs,
         )
 
-        # Cross-validation score
-        with warnings.catch_warnings():
+        # Fold workers are limited to one BLAS/OpenMP thread each. Serial folds skip
+        # the override so ensembles keep their own (threaded) Parallel backend.
+        fold_parallelism = (
+            joblib.parallel_config(backend="loky", inner_max_num_threads=1)
+            if cv_n_jobs != 1
+            else contextlib.nullcontext()
+        )
+        with warnings.catch_warnings(), fold_parallelism:
             warnings.simplefilter("ignore")
             scores = cross_val_score(
                 model,
@@ -74,7 +113,7 @@ def optimize_hyperparameters(
                 y_train,
                 cv=config.cv_folds,
                 scoring=scoring,
-                n_jobs=1,  # Already using n_jobs in model
+                n_jobs=cv_n_jobs,
             )
 
         score = float(np.mean(scores))
@@ -89,18 +128,26 @@ def optimize_hyperparameters(
 
         return score
 
+    def stop_if_cancelled(study: optuna.Study, _: optuna.trial.FrozenTrial) -> None:
+        if reporter.is_cancelled():
+            study.stop()
+
     # Create and run study
     study = optuna.create_study(direction=direction)
 
-    try:
-        study.optimize(
-            objective,
-            n_trials=config.n_trials,
-            show_progress_bar=False,
-            catch=(Exception,),
-        )
-    except CancelledError:
-        raise
+    # Any trial error (including booster-specific ones such as LightGBMError) only
+    # fails that trial. Cancellation is handled by the callback, which stops the
+    # study after the current trial, and re-raised once optimize returns.
+    study.optimize(
+        objective,
+        n_trials=config.n_trials,
+        show_progress_bar=False,
+        catch=(Exception,),
+        callbacks=[stop_if_cancelled],
+    )
+
+    if reporter.is_cancelled():
+        raise CancelledError()
 
     # Create final model with best params
     best_params = study.best_params if study.best_trial else {}
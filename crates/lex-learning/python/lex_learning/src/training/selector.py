@@ -86,6 +86,36 @@ REGRESSION_PRIORITIES = {
 }
 
 
+# Tree-based models boosted to the front of the priority list for high dimensional data
+HIGH_DIMENSIONAL_PREFERRED = (
+    "random_forest",
+    "extra_trees",
+    "xgboost",
+    "lightgbm",
+    "gradient_boosting",
+)
+
+
+def _build_selection_table() -> dict[tuple[ProblemType, str, bool], tuple[str, ...]]:
+    """Precompute priority orders for every (problem type, size, dimensionality) key."""
+    table: dict[tuple[ProblemType, str, bool], tuple[str, ...]] = {}
+    for problem_type, priorities in (
+        (ProblemType.CLASSIFICATION, CLASSIFICATION_PRIORITIES),
+        (ProblemType.REGRESSION, REGRESSION_PRIORITIES),
+    ):
+        for size_category, priority_list in priorities.items():
+            table[(problem_type, size_category, False)] = tuple(priority_list)
+            table[(problem_type, size_category, True)] = tuple(
+                [m for m in HIGH_DIMENSIONAL_PREFERRED if m in priority_list]
+                + [m for m in priority_list if m not in HIGH_DIMENSIONAL_PREFERRED]
+            )
+    return table
+
+
+# Priority order keyed by (problem_type, size_category, is_high_dimensional)
+SELECTION_TABLE = _build_selection_table()
+
+
 def select_algorithms(
     dataset_info: DatasetInfo,
     available_algorithms: list[str],
@@ -103,12 +133,6 @@ def select_algorithms(
     Returns:
         List of selected algorithm names (up to top_k).
     """
-    # Get priority list based on problem type and dataset size
-    if dataset_info.problem_type == ProblemType.CLASSIFICATION:
-        priority_list = CLASSIFICATION_PRIORITIES[dataset_info.size_category]
-    else:
-        priority_list = REGRESSION_PRIORITIES[dataset_info.size_category]
-
     # Filter by available algorithms
     available_set = set(available_algorithms)
 
@@ -116,21 +140,26 @@ def select_algorithms(
     if not include_neural:
         available_set.discard("neural_network")
 
-    # High dimensional data: prefer tree-based models
-    if dataset_info.is_high_dimensional:
-        # Boost tree-based models in priority
-        tree_models = ["random_forest", "extra_trees", "xgboost", "lightgbm", "gradient_boosting"]
-        priority_list = [m for m in tree_models if m in priority_list] + [
-            m for m in priority_list if m not in tree_models
-        ]
-
-    # Select top-k from priority list that are available
-    selected = []
-    for algo in priority_list:
-        if algo in available_set and algo not in selected:
-            selected.append(algo)
-            if len(selected) >= top_k:
-                break
+    # Priority order for problem type, dataset size and dimensionality
+    # (high dimensional data prefers tree-based models)
+    priority_order = SELECTION_TABLE[
+        (
+            dataset_info.problem_type,
+            dataset_info.size_category,
+            dataset_info.is_high_dimensional,
+        )
+    ]
+
+    # Select top-k from priority order that are available
+    selected = [algo for algo in priority_order if algo in available_set]
+
+    # Every available algorithm fits within top_k: append the rest in given order
+    if top_k >= len(available_set):
+        remaining = available_set.difference(selected)
+        selected.extend(algo for algo in dict.fromkeys(available_algorithms) if algo in remaining)
+        return selected
+
+    selected = selected[:top_k]
 
     # If we don't have enough, add remaining available algorithms
     if len(selected) < top_k:
@@ -98,6 +98,8 @@ def train_single_model(
 
         return model, result
 
+    except CancelledError:
+        raise
     except Exception as e:
         logger.warning(f"Training {algorithm} failed: {e}")
         return None
@@ -3,159 +3,275 @@
 from __future__ import annotations
 
 import tempfile
+from collections import deque
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from src import PipelineConfig, ProblemType
+from src import Pipeline, PipelineConfig, ProblemType, TrainedModel, TrainingResult
+from src.preprocessing import Preprocessor
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the ``--fast`` option used by ``optuna_classification_config``."""
+    parser.addoption(
+        "--fast",
+        action="store_true",
+        default=False,
+        help="run the Optuna optimization test with a single trial",
+    )
+
 
 # =============================================================================
 # Test Data Fixtures
 # =============================================================================
+#
+# Datasets are deterministic, so each one is generated once per session by a
+# private fixture (``_<name>``). The public fixture is a thin function-scoped
+# indirection returning a copy, so tests that mutate their data stay isolated.
+# Columns use the narrowest dtype that fits their range (int8/int16/float32,
+# pandas categoricals) to keep the frames small.
+
+# Independent child seeds, one per dataset, so no fixture shares random state
+(
+    _CLASSIFICATION_SEED,
+    _BINARY_SEED,
+    _REGRESSION_SEED,
+    _MIXED_TYPES_SEED,
+    _SMALL_CLASSIFICATION_SEED,
+    _SMALL_REGRESSION_SEED,
+    _TINY_NUMERIC_SEED,
+) = np.random.SeedSequence(42).spawn(7)
+
+
+def _fast_df(arrays: list[Any], columns: list[str], n: int) -> pd.DataFrame:
+    """Assemble a DataFrame from 1-D columns whose dtypes are already final.
+
+    Uses pandas' internal array constructor to skip per-column dtype inference,
+    falling back to the public constructor if that path is unavailable.
+    """
+    try:
+        return pd.DataFrame._from_arrays(
+            arrays, columns=pd.Index(columns), index=pd.RangeIndex(n), verify_integrity=False
+        )
+    except AttributeError:
+        return pd.DataFrame(dict(zip(columns, arrays, strict=True)), copy=False)
 
 
-@pytest.fixture
-def classification_data() -> pd.DataFrame:
+@pytest.fixture(scope="session")
+def _classification_data() -> pd.DataFrame:
     """Create a simple classification dataset (Iris-like).
 
     Returns:
         DataFrame with numeric features and categorical target.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_CLASSIFICATION_SEED)
     n_samples = 150
 
-    # Generate features
-    data = {
-        "feature_a": np.random.randn(n_samples),
-        "feature_b": np.random.randn(n_samples) * 2,
-        "feature_c": np.random.randn(n_samples) + 1,
-        "feature_d": np.random.randn(n_samples) - 1,
-    }
-
-    # Generate target based on features (simple linear combination)
-    score = data["feature_a"] + data["feature_b"] * 0.5 - data["feature_c"]
-    data["target"] = pd.cut(score, bins=3, labels=["class_0", "class_1", "class_2"]).astype(str)
+    # Generate all features in one draw, then scale/shift per column
+    features = rng.standard_normal((n_samples, 4)) * np.array([1.0, 2.0, 1.0, 1.0])
+    features += np.array([0.0, 0.0, 1.0, -1.0])
+
+    # Generate target based on features (simple linear combination),
+    # bucketed into three equally sized classes by the score tertiles
+    score = features @ np.array([1.0, 0.5, -1.0, 0.0])
+    cut_points = np.quantile(score, [1 / 3, 2 / 3])
+    target = pd.Categorical.from_codes(
+        np.searchsorted(cut_points, score).astype(np.int8),
+        categories=["class_0", "class_1", "class_2"],
+    )
 
-    return pd.DataFrame(data)
+    return _fast_df(
+        [*features.T, target],
+        ["feature_a", "feature_b", "feature_c", "feature_d", "target"],
+        n_samples,
+    )
 
 
 @pytest.fixture
-def binary_classification_data() -> pd.DataFrame:
+def classification_data(_classification_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session classification dataset."""
+    return _classification_data.copy()
+
+
+@pytest.fixture(scope="session")
+def _binary_classification_data() -> pd.DataFrame:
     """Create a binary classification dataset.
 
     Returns:
         DataFrame with numeric features and binary target.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_BINARY_SEED)
     n_samples = 200
 
-    data = {
-        "age": np.random.randint(18, 80, n_samples),
-        "income": np.random.exponential(50000, n_samples),
-        "score": np.random.randn(n_samples) * 100 + 500,
-    }
+    age = rng.integers(18, 80, n_samples, dtype=np.int16)
+    income = rng.exponential(50000, n_samples)
+    score = rng.standard_normal(n_samples) * 100 + 500
 
     # Binary target based on simple rule
-    prob = 1 / (1 + np.exp(-(data["income"] / 50000 - 1)))
-    data["target"] = (np.random.random(n_samples) < prob).astype(int)
+    prob = 1 / (1 + np.exp(-(income / 50000 - 1)))
+    target = rng.random(n_samples) < prob
 
-    return pd.DataFrame(data)
+    return _fast_df([age, income, score, target], ["age", "income", "score", "target"], n_samples)
 
 
 @pytest.fixture
-def regression_data() -> pd.DataFrame:
+def binary_classification_data(_binary_classification_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session binary classification dataset."""
+    return _binary_classification_data.copy()
+
+
+@pytest.fixture(scope="session")
+def _regression_data() -> pd.DataFrame:
     """Create a simple regression dataset.
 
     Returns:
         DataFrame with numeric features and continuous target.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_REGRESSION_SEED)
     n_samples = 200
 
-    # Generate features
-    data = {
-        "size": np.random.uniform(500, 5000, n_samples),
-        "bedrooms": np.random.randint(1, 6, n_samples),
-        "age": np.random.uniform(0, 50, n_samples),
-        "location_score": np.random.uniform(1, 10, n_samples),
-    }
-
-    # Target: house price based on features
-    noise = np.random.randn(n_samples) * 10000
-    data["price"] = (
-        data["size"] * 100
-        + data["bedrooms"] * 20000
-        - data["age"] * 1000
-        + data["location_score"] * 15000
-        + noise
+    # Generate features into one float64 block (size, bedrooms, age, location_score),
+    # drawing the continuous columns in a single call
+    features = np.empty((n_samples, 4))
+    features[:, [0, 2, 3]] = rng.uniform([500, 0, 1], [5000, 50, 10], size=(n_samples, 3))
+    features[:, 1] = rng.integers(1, 6, n_samples)
+
+    # Target: house price based on features, accumulated into the noise buffer
+    price = np.empty(n_samples)
+    rng.standard_normal(out=price)
+    price *= 10000
+    price += features @ np.array([100.0, 20000.0, -1000.0, 15000.0])
+
+    return _fast_df(
+        [features[:, 0], features[:, 1].astype(np.int8), features[:, 2], features[:, 3], price],
+        ["size", "bedrooms", "age", "location_score", "price"],
+        n_samples,
     )
 
-    return pd.DataFrame(data)
-
 
 @pytest.fixture
-def mixed_types_data() -> pd.DataFrame:
+def regression_data(_regression_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session regression dataset."""
+    return _regression_data.copy()
+
+
+@pytest.fixture(scope="session")
+def _mixed_types_data() -> pd.DataFrame:
     """Create a dataset with mixed numeric and categorical features.
 
     Returns:
         DataFrame with both numeric and categorical features.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_MIXED_TYPES_SEED)
     n_samples = 150
 
-    data = {
-        "numeric_1": np.random.randn(n_samples),
-        "numeric_2": np.random.uniform(0, 100, n_samples),
-        "category_1": np.random.choice(["A", "B", "C"], n_samples),
-        "category_2": np.random.choice(["X", "Y"], n_samples),
-        "target": np.random.choice([0, 1], n_samples),
-    }
-
-    return pd.DataFrame(data)
+    arrays = [
+        rng.standard_normal(n_samples),
+        rng.uniform(0, 100, n_samples),
+        pd.Categorical.from_codes(
+            rng.integers(0, 3, n_samples, dtype=np.int8), categories=["A", "B", "C"]
+        ),
+        pd.Categorical.from_codes(
+            rng.integers(0, 2, n_samples, dtype=np.int8), categories=["X", "Y"]
+        ),
+        rng.choice([0, 1], n_samples),
+    ]
+
+    return _fast_df(
+        arrays, ["numeric_1", "numeric_2", "category_1", "category_2", "target"], n_samples
+    )
 
 
 @pytest.fixture
-def small_classification_data() -> pd.DataFrame:
+def mixed_types_data(_mixed_types_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session mixed-types dataset."""
+    return _mixed_types_data.copy()
+
+
+@pytest.fixture(scope="session")
+def _small_classification_data() -> pd.DataFrame:
     """Create a very small classification dataset for fast tests.
 
     Returns:
         DataFrame with 50 samples for quick testing.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_SMALL_CLASSIFICATION_SEED)
     n_samples = 50
 
-    data = {
-        "x1": np.random.randn(n_samples),
-        "x2": np.random.randn(n_samples),
-        "target": np.random.choice(["yes", "no"], n_samples),
-    }
+    arrays = [
+        rng.standard_normal(n_samples, dtype=np.float32),
+        rng.standard_normal(n_samples, dtype=np.float32),
+        pd.Categorical(rng.choice(["yes", "no"], n_samples), categories=["yes", "no"]),
+    ]
 
-    return pd.DataFrame(data)
+    return _fast_df(arrays, ["x1", "x2", "target"], n_samples)
 
 
 @pytest.fixture
-def small_regression_data() -> pd.DataFrame:
+def small_classification_data(_small_classification_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session small classification dataset."""
+    return _small_classification_data.copy()
+
+
+@pytest.fixture(scope="session")
+def _small_regression_data() -> pd.DataFrame:
     """Create a very small regression dataset for fast tests.
 
     Returns:
         DataFrame with 50 samples for quick testing.
     """
-    np.random.seed(42)
+    rng = np.random.default_rng(_SMALL_REGRESSION_SEED)
     n_samples = 50
 
-    x1 = np.random.randn(n_samples)
-    x2 = np.random.randn(n_samples)
+    # Third column is the noise term; its 0.5 scale is folded into the coefficients
+    z = rng.standard_normal((n_samples, 3), dtype=np.float32)
+    target = z @ np.array([2.0, 3.0, 0.5])
+
+    return _fast_df([z[:, 0], z[:, 1], target], ["x1", "x2", "target"], n_samples)
+
+
+@pytest.fixture
+def small_regression_data(_small_regression_data: pd.DataFrame) -> pd.DataFrame:
+    """Per-test copy of the session small regression dataset."""
+    return _small_regression_data.copy()
 
-    data = {
-        "x1": x1,
-        "x2": x2,
-        "target": x1 * 2 + x2 * 3 + np.random.randn(n_samples) * 0.5,
-    }
 
-    return pd.DataFrame(data)
+@pytest.fixture(scope="session")
+def tiny_numeric_xy() -> tuple[pd.DataFrame, pd.Series]:
+    """Two numeric features and a binary target for shape checks (read-only).
+
+    Returns:
+        Tuple of (X, y) with 32 rows.
+    """
+    rng = np.random.default_rng(_TINY_NUMERIC_SEED)
+    n_samples = 32
+
+    X = _fast_df(
+        [rng.standard_normal(n_samples), rng.standard_normal(n_samples)], ["a", "b"], n_samples
+    )
+    return X, pd.Series(rng.integers(0, 2, n_samples, dtype=np.int8))
+
+
+@pytest.fixture(scope="session")
+def features_head5(_small_classification_data: pd.DataFrame) -> pd.DataFrame:
+    """First five feature rows of the small classification dataset (read-only)."""
+    return _small_classification_data.drop(columns=["target"]).head(5)
+
+
+@pytest.fixture(scope="session")
+def features_head1(features_head5: pd.DataFrame) -> pd.DataFrame:
+    """First feature row of the small classification dataset (read-only)."""
+    return features_head5.head(1)
+
+
+@pytest.fixture(scope="session")
+def first_sample_dict(features_head1: pd.DataFrame) -> dict[str, Any]:
+    """First feature row of the small classification dataset as a dict (read-only)."""
+    return features_head1.iloc[0].to_dict()
 
 
 # =============================================================================
@@ -163,55 +279,294 @@ def small_regression_data() -> pd.DataFrame:
 # =============================================================================
 
 
-@pytest.fixture
-def classification_config() -> PipelineConfig:
-    """Create a minimal classification config for fast testing."""
-    return (
+# Fields that differ between the test configs; everything else comes from _build
+_CLF_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "top_k_algorithms": 1,
+    "enable_explainability": False,
+}
+_REG_CFG = {
+    "problem_type": ProblemType.REGRESSION,
+    "top_k_algorithms": 1,
+    "enable_explainability": False,
+}
+_EXPLAIN_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "algorithm": "decision_tree",  # Fast, SHAP-compatible
+    "enable_explainability": True,
+    "shap_max_samples": 20,
+}
+_TOPK2_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "top_k_algorithms": 2,
+    "enable_explainability": False,
+}
+_LOGREG_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "algorithm": "logistic_regression",  # Supports predict_proba
+    "enable_explainability": False,
+}
+_TRAIN_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "optimize_hyperparams": False,
+}
+_OPTUNA_CFG = {
+    "problem_type": ProblemType.CLASSIFICATION,
+    "optimize_hyperparams": True,
+}
+
+
+def _build(spec: dict[str, Any]) -> PipelineConfig:
+    """Build a minimal, fast config with the given builder overrides applied."""
+    builder = (
         PipelineConfig.builder()
-        .problem_type(ProblemType.CLASSIFICATION)
         .target_column("target")
-        .top_k_algorithms(1)
         .n_trials(2)
         .cv_folds(2)
         .enable_neural_networks(False)
-        .enable_explainability(False)
-        .build()
     )
+    for method, value in spec.items():
+        getattr(builder, method)(value)
+    return builder.build()
 
 
-@pytest.fixture
+# Built once at import; PipelineConfig is never mutated by the tests
+_CLASSIFICATION_CONFIG = _build(_CLF_CFG)
+_REGRESSION_CONFIG = _build(_REG_CFG)
+_EXPLAINABILITY_CONFIG = _build(_EXPLAIN_CFG)
+_DEFAULT_CLASSIFICATION_CONFIG = _build(_TRAIN_CFG)
+
+
+@pytest.fixture(scope="session")
+def classification_config() -> PipelineConfig:
+    """Create a minimal classification config for fast testing."""
+    return _CLASSIFICATION_CONFIG
+
+
+@pytest.fixture(scope="session")
 def regression_config() -> PipelineConfig:
     """Create a minimal regression config for fast testing."""
-    return (
-        PipelineConfig.builder()
-        .problem_type(ProblemType.REGRESSION)
-        .target_column("target")
-        .top_k_algorithms(1)
-        .n_trials(2)
-        .cv_folds(2)
-        .enable_neural_networks(False)
-        .enable_explainability(False)
-        .build()
-    )
+    return _REGRESSION_CONFIG
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def default_classification_config() -> PipelineConfig:
+    """Classification config for direct trainer calls, without hyperparameter search."""
+    return _DEFAULT_CLASSIFICATION_CONFIG
+
+
+@pytest.fixture(scope="session")
+def n_trials(request: pytest.FixtureRequest) -> int:
+    """Trial budget for optuna_classification_config: 1 under ``--fast``, otherwise 3."""
+    return 1 if request.config.getoption("--fast") else 3
+
+
+@pytest.fixture(scope="session")
+def optuna_classification_config(n_trials: int) -> PipelineConfig:
+    """Classification config that runs a short Optuna search."""
+    return _build({**_OPTUNA_CFG, "n_trials": n_trials})
+
+
+@pytest.fixture(scope="session")
 def explainability_config() -> PipelineConfig:
     """Create a config with explainability enabled."""
-    return (
-        PipelineConfig.builder()
-        .problem_type(ProblemType.CLASSIFICATION)
-        .target_column("target")
-        .algorithm("decision_tree")  # Fast, SHAP-compatible
-        .n_trials(2)
-        .cv_folds(2)
-        .enable_neural_networks(False)
-        .enable_explainability(True)
-        .shap_max_samples(20)
-        .build()
+    return _EXPLAINABILITY_CONFIG
+
+
+# =============================================================================
+# Fitted Model Fixtures
+# =============================================================================
+
+
+class FittedClassification(NamedTuple):
+    """Preprocessed small classification data with a fitted decision tree."""
+
+    X_transformed: np.ndarray
+    y_transformed: np.ndarray
+    feature_names: list[str]
+    model: Any
+
+
+@pytest.fixture(scope="session")
+def small_clf_fitted(_small_classification_data: pd.DataFrame) -> FittedClassification:
+    """Preprocess the small classification dataset and fit a shallow tree once.
+
+    Returns:
+        FittedClassification shared by tests that only read it.
+    """
+    from sklearn.tree import DecisionTreeClassifier
+
+    X = _small_classification_data.drop(columns=["target"])
+    y = _small_classification_data["target"]
+
+    prep = Preprocessor(ProblemType.CLASSIFICATION)
+    X_transformed, y_transformed = prep.fit_transform(X, y)
+
+    model = DecisionTreeClassifier(random_state=42, max_depth=3)
+    model.fit(X_transformed, y_transformed)
+
+    return FittedClassification(
+        X_transformed=X_transformed,
+        y_transformed=y_transformed,
+        feature_names=prep.transformed_feature_names,
+        model=model,
     )
 
 
+class FittedMixedPreprocessor(NamedTuple):
+    """Preprocessor fitted on the mixed-types dataset with its inputs and outputs."""
+
+    preprocessor: Preprocessor
+    X_transformed: np.ndarray
+    y_transformed: np.ndarray
+    X: pd.DataFrame
+    y: pd.Series
+
+
+@pytest.fixture(scope="session")
+def fitted_mixed_prep(_mixed_types_data: pd.DataFrame) -> FittedMixedPreprocessor:
+    """Fit a classification Preprocessor on the mixed-types dataset once.
+
+    Returns:
+        FittedMixedPreprocessor shared by tests that only read it.
+    """
+    X = _mixed_types_data.drop(columns=["target"])
+    y = _mixed_types_data["target"]
+
+    prep = Preprocessor(ProblemType.CLASSIFICATION)
+    X_transformed, y_transformed = prep.fit_transform(X, y)
+
+    return FittedMixedPreprocessor(prep, X_transformed, y_transformed, X, y)
+
+
+@pytest.fixture(scope="session")
+def legacy_mixed_prep(_mixed_types_data: pd.DataFrame) -> Preprocessor:
+    """Preprocessor in the legacy ColumnTransformer layout, fitted on mixed types.
+
+    Mirrors the state pickled by releases before the positional-block transform:
+    a fitted ``_feature_transformer`` and none of the attributes added since. It is
+    only usable after a pickle round trip, which migrates it in ``__setstate__``.
+    """
+    from sklearn.compose import ColumnTransformer
+    from sklearn.pipeline import Pipeline as SklearnPipeline
+    from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler
+
+    X = _mixed_types_data.drop(columns=["target"])
+    y = _mixed_types_data["target"]
+    numeric_features = ["numeric_1", "numeric_2"]
+    categorical_features = ["category_1", "category_2"]
+
+    feature_transformer = ColumnTransformer(
+        transformers=[
+            ("numeric", SklearnPipeline([("scaler", StandardScaler())]), numeric_features),
+            (
+                "categorical",
+                SklearnPipeline(
+                    [("encoder", OneHotEncoder(handle_unknown="ignore", sparse_output=False))]
+                ),
+                categorical_features,
+            ),
+        ],
+        remainder="drop",
+    ).fit(X)
+    target_encoder = LabelEncoder().fit(y)
+
+    prep = Preprocessor.__new__(Preprocessor)
+    prep.__dict__.update(
+        problem_type=ProblemType.CLASSIFICATION,
+        _feature_transformer=feature_transformer,
+        _target_encoder=target_encoder,
+        _feature_names=[str(c) for c in X.columns],
+        _numeric_features=numeric_features,
+        _categorical_features=categorical_features,
+        _class_labels=[str(c) for c in target_encoder.classes_],
+        _is_fitted=True,
+    )
+    return prep
+
+
+class PreprocessedSplit(NamedTuple):
+    """Preprocessed train/test split together with the fitted preprocessor."""
+
+    X_train: np.ndarray
+    X_test: np.ndarray
+    y_train: np.ndarray
+    y_test: np.ndarray
+    preprocessor: Preprocessor
+
+
+@pytest.fixture(scope="session")
+def preprocessed_small_classification(
+    _small_classification_data: pd.DataFrame,
+) -> PreprocessedSplit:
+    """Preprocess and split the small classification dataset once.
+
+    Returns:
+        PreprocessedSplit shared by training tests that only read it.
+    """
+    from sklearn.model_selection import train_test_split
+
+    X = _small_classification_data.drop(columns=["target"])
+    y = _small_classification_data["target"]
+
+    prep = Preprocessor(ProblemType.CLASSIFICATION)
+    X_transformed, y_transformed = prep.fit_transform(X, y)
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        X_transformed, y_transformed, test_size=0.2, random_state=42
+    )
+    return PreprocessedSplit(X_train, X_test, y_train, y_test, prep)
+
+
+class TrainedPipeline(NamedTuple):
+    """A pipeline together with its training result and exported model."""
+
+    pipeline: Pipeline
+    result: TrainingResult
+    trained_model: TrainedModel
+
+
+def _train_bundle(config: PipelineConfig, data: pd.DataFrame) -> TrainedPipeline:
+    """Train a pipeline on a copy of data and export its model."""
+    pipeline = Pipeline.builder().config(config).build()
+    result = pipeline.train(data.copy())
+    return TrainedPipeline(pipeline, result, pipeline.create_trained_model(result))
+
+
+@pytest.fixture(scope="session")
+def trained_classification_bundle(_small_classification_data: pd.DataFrame) -> TrainedPipeline:
+    """Minimal classification pipeline trained on the small dataset."""
+    return _train_bundle(_CLASSIFICATION_CONFIG, _small_classification_data)
+
+
+@pytest.fixture(scope="session")
+def saved_model_path(
+    tmp_path_factory: pytest.TempPathFactory, trained_classification_bundle: TrainedPipeline
+) -> Path:
+    """Path of the classification model saved once to a temp directory."""
+    path = tmp_path_factory.mktemp("saved_model") / "model.pkl"
+    trained_classification_bundle.trained_model.save(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def regression_bundle(_small_regression_data: pd.DataFrame) -> TrainedPipeline:
+    """Minimal regression pipeline trained on the small dataset."""
+    return _train_bundle(_REGRESSION_CONFIG, _small_regression_data)
+
+
+@pytest.fixture(scope="session")
+def logreg_trained_model(_small_classification_data: pd.DataFrame) -> TrainedModel:
+    """Logistic regression model trained on the small classification dataset."""
+    return _train_bundle(_build(_LOGREG_CFG), _small_classification_data).trained_model
+
+
+@pytest.fixture(scope="session")
+def topk2_result(_small_classification_data: pd.DataFrame) -> TrainingResult:
+    """Result of training the top two algorithms on the small classification dataset."""
+    return _train_bundle(_build(_TOPK2_CFG), _small_classification_data).result
+
+
 # =============================================================================
 # Utility Fixtures
 # =============================================================================
@@ -233,11 +588,11 @@ def progress_tracker() -> dict[str, Any]:
     """Create a progress tracker for testing callbacks.
 
     Returns:
-        Dictionary to store progress updates.
+        Dictionary to store progress updates (bounded to the most recent 4096).
     """
     tracker: dict[str, Any] = {
-        "updates": [],
-        "stages": [],
+        "updates": deque(maxlen=4096),
+        "stages": deque(maxlen=4096),
         "final_progress": 0.0,
     }
     return tracker
@@ -253,18 +608,3 @@ def make_progress_callback(tracker: dict[str, Any]):
         tracker["final_progress"] = update.progress
 
     return callback
-
-
-# =============================================================================
-# Markers
-# =============================================================================
-
-
-def pytest_configure(config):
-    """Register custom markers."""
-    config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marks tests as integration tests (full pipeline)"
-    )
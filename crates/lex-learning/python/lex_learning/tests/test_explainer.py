@@ -7,6 +7,9 @@ import pytest
 from src import ExplainabilityResult, Pipeline, PipelineConfig, ProblemType
 from src.explainability import explain_model, save_explainability_plots
 
+# Minimal PNG-signed payload standing in for rendered plot bytes
+FAKE_PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(100)
+
 
 class TestExplainabilityResult:
     """Tests for ExplainabilityResult dataclass."""
@@ -40,27 +43,13 @@ class TestExplainModel:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_explain_tree_model(self, small_classification_data):
+    def test_explain_tree_model(self, small_clf_fitted):
         """Can explain a tree-based model."""
-        from sklearn.tree import DecisionTreeClassifier
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        # Train a simple model
-        model = DecisionTreeClassifier(random_state=42, max_depth=3)
-        model.fit(X_transformed, y_transformed)
-
         # Explain
         result = explain_model(
-            model=model,
-            X_sample=X_transformed,
-            feature_names=prep.transformed_feature_names,
+            model=small_clf_fitted.model,
+            X_sample=small_clf_fitted.X_transformed,
+            feature_names=small_clf_fitted.feature_names,
             problem_type=ProblemType.CLASSIFICATION,
             max_samples=20,
         )
@@ -71,25 +60,17 @@ class TestExplainModel:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_explain_linear_model(self, small_classification_data):
+    def test_explain_linear_model(self, small_clf_fitted):
         """Can explain a linear model."""
         from sklearn.linear_model import LogisticRegression
 
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
         model = LogisticRegression(random_state=42, max_iter=200)
-        model.fit(X_transformed, y_transformed)
+        model.fit(small_clf_fitted.X_transformed, small_clf_fitted.y_transformed)
 
         result = explain_model(
             model=model,
-            X_sample=X_transformed,
-            feature_names=prep.transformed_feature_names,
+            X_sample=small_clf_fitted.X_transformed,
+            feature_names=small_clf_fitted.feature_names,
             problem_type=ProblemType.CLASSIFICATION,
             max_samples=20,
         )
@@ -98,26 +79,13 @@ class TestExplainModel:
         assert result.method in ["shap", "shap_failed", "none", "failed"]
 
     @pytest.mark.slow
-    def test_max_samples_limit(self, small_classification_data):
+    def test_max_samples_limit(self, small_clf_fitted):
         """max_samples limits the data used for explanation."""
-        from sklearn.tree import DecisionTreeClassifier
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        model = DecisionTreeClassifier(random_state=42, max_depth=3)
-        model.fit(X_transformed, y_transformed)
-
         # Should not raise even with small max_samples
         result = explain_model(
-            model=model,
-            X_sample=X_transformed,
-            feature_names=prep.transformed_feature_names,
+            model=small_clf_fitted.model,
+            X_sample=small_clf_fitted.X_transformed,
+            feature_names=small_clf_fitted.feature_names,
             problem_type=ProblemType.CLASSIFICATION,
             max_samples=5,
         )
@@ -138,12 +106,9 @@ class TestSaveExplainabilityPlots:
 
     def test_save_with_plots(self, temp_dir):
         """Can save plots to disk."""
-        # Create fake plot bytes
-        fake_png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
-
         result = ExplainabilityResult(
-            summary_plot=fake_png,
-            feature_importance_plot=fake_png,
+            summary_plot=FAKE_PNG_BYTES,
+            feature_importance_plot=FAKE_PNG_BYTES,
             method="shap",
         )
 
@@ -157,8 +122,7 @@ class TestSaveExplainabilityPlots:
         """Saving creates output directory if needed."""
         output_path = temp_dir / "subdir" / "plots"
 
-        fake_png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
-        result = ExplainabilityResult(summary_plot=fake_png, method="shap")
+        result = ExplainabilityResult(summary_plot=FAKE_PNG_BYTES, method="shap")
 
         save_explainability_plots(result, output_path)
 
@@ -228,25 +192,12 @@ class TestExplainabilityPlotGeneration:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_generates_summary_plot(self, small_classification_data):
+    def test_generates_summary_plot(self, small_clf_fitted):
         """Generates summary plot bytes."""
-        from sklearn.tree import DecisionTreeClassifier
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        model = DecisionTreeClassifier(random_state=42, max_depth=3)
-        model.fit(X_transformed, y_transformed)
-
         result = explain_model(
-            model=model,
-            X_sample=X_transformed,
-            feature_names=prep.transformed_feature_names,
+            model=small_clf_fitted.model,
+            X_sample=small_clf_fitted.X_transformed,
+            feature_names=small_clf_fitted.feature_names,
             problem_type=ProblemType.CLASSIFICATION,
             max_samples=20,
         )
@@ -258,25 +209,12 @@ class TestExplainabilityPlotGeneration:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_feature_importance_sorted(self, small_classification_data):
+    def test_feature_importance_sorted(self, small_clf_fitted):
         """Feature importance is sorted by value."""
-        from sklearn.tree import DecisionTreeClassifier
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        model = DecisionTreeClassifier(random_state=42, max_depth=3)
-        model.fit(X_transformed, y_transformed)
-
         result = explain_model(
-            model=model,
-            X_sample=X_transformed,
-            feature_names=prep.transformed_feature_names,
+            model=small_clf_fitted.model,
+            X_sample=small_clf_fitted.X_transformed,
+            feature_names=small_clf_fitted.feature_names,
             problem_type=ProblemType.CLASSIFICATION,
             max_samples=20,
         )
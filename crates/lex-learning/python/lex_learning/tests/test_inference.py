@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
+from sklearn.tree import DecisionTreeClassifier
 
-from src import Pipeline, PipelineConfig, ProblemType, TrainedModel
+from src import ProblemType, TrainedModel
+from src.core import ClassificationMetrics, ExplainabilityResult
 from src.errors import InferenceError, ModelNotFoundError
+from src.inference.artifact import create_artifact
 
 
 class TestTrainedModelSaveLoad:
@@ -13,31 +18,18 @@ class TestTrainedModelSaveLoad:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_save_model(self, small_classification_data, classification_config, temp_dir):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_save_model(self, saved_model_path):
         """Can save a trained model."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-        model_path = temp_dir / "model.pkl"
-
-        trained_model.save(model_path)
-
-        assert model_path.exists()
-        assert model_path.stat().st_size > 0
+        assert saved_model_path.exists()
+        assert saved_model_path.stat().st_size > 0
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_load_model(self, small_classification_data, classification_config, temp_dir):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_load_model(self, saved_model_path):
         """Can load a saved model."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-        model_path = temp_dir / "model.pkl"
-        trained_model.save(model_path)
-
-        loaded_model = TrainedModel.load(model_path)
+        loaded_model = TrainedModel.load(saved_model_path)
 
         assert loaded_model is not None
         assert loaded_model.problem_type == ProblemType.CLASSIFICATION
@@ -45,24 +37,84 @@ class TestTrainedModelSaveLoad:
 
     @pytest.mark.slow
     @pytest.mark.integration
+    @pytest.mark.xdist_group("trained_clf")
     def test_loaded_model_has_same_properties(
-        self, small_classification_data, classification_config, temp_dir
+        self, trained_classification_bundle, saved_model_path
     ):
         """Loaded model has same properties as original."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+        original = trained_classification_bundle.trained_model
 
-        original = pipeline.create_trained_model(result)
-        model_path = temp_dir / "model.pkl"
-        original.save(model_path)
-
-        loaded = TrainedModel.load(model_path)
+        loaded = TrainedModel.load(saved_model_path)
 
         assert loaded.problem_type == original.problem_type
         assert loaded.target_column == original.target_column
         assert loaded.feature_names == original.feature_names
         assert loaded.best_model_name == original.best_model_name
 
+    def test_load_legacy_single_pickle(self, legacy_mixed_prep, mixed_types_data, temp_dir):
+        """Artifacts saved as one plain pickle by earlier releases still predict."""
+        X = mixed_types_data.drop(columns=["target"])
+        feature_transformer = legacy_mixed_prep.__dict__["_feature_transformer"]
+        target_encoder = legacy_mixed_prep.__dict__["_target_encoder"]
+
+        X_transformed = feature_transformer.transform(X)
+        model = DecisionTreeClassifier(random_state=42, max_depth=3)
+        model.fit(X_transformed, target_encoder.transform(mixed_types_data["target"]))
+        expected = target_encoder.inverse_transform(model.predict(X_transformed))
+
+        artifact = create_artifact(
+            model=model,
+            preprocessor=legacy_mixed_prep,
+            problem_type=ProblemType.CLASSIFICATION,
+            target_column="target",
+            feature_names=legacy_mixed_prep.feature_names,
+            class_labels=legacy_mixed_prep.class_labels,
+            metrics=ClassificationMetrics(),
+            best_model_name="decision_tree",
+            training_time_seconds=0.0,
+            explainability=ExplainabilityResult(),
+        )
+        artifact.version = "1.0"
+        model_path = temp_dir / "legacy.pkl"
+        with open(model_path, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        loaded = TrainedModel.load(model_path)
+
+        assert loaded.predict(X.iloc[0].to_dict())["prediction"] == expected[0]
+        assert list(loaded.predict_batch(X.head(5))["prediction"]) == list(expected[:5])
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    @pytest.mark.xdist_group("trained_clf")
+    @pytest.mark.parametrize("cut", ["empty", "header", "payload", "buffers"])
+    def test_load_truncated_raises(self, saved_model_path, temp_dir, cut):
+        """Loading a truncated artifact raises InferenceError instead of zero-filling."""
+        data = saved_model_path.read_bytes()
+        with open(saved_model_path, "rb") as f:
+            _, payload_size, _ = pickle.load(f)
+            payload_start = f.tell()
+        end = {
+            "empty": 0,
+            "header": payload_start // 2,
+            "payload": payload_start + payload_size // 2,
+            "buffers": len(data) - 16,
+        }[cut]
+
+        model_path = temp_dir / "truncated.pkl"
+        model_path.write_bytes(data[:end])
+
+        with pytest.raises(InferenceError, match="truncated"):
+            TrainedModel.load(model_path)
+
+    def test_load_unrecognized_format_raises(self, temp_dir):
+        """A pickle that is neither an artifact nor an artifact header is rejected."""
+        model_path = temp_dir / "other.pkl"
+        model_path.write_bytes(pickle.dumps({"not": "an artifact"}))
+
+        with pytest.raises(InferenceError, match="Unrecognized"):
+            TrainedModel.load(model_path)
+
     def test_load_nonexistent_raises(self, temp_dir):
         """Loading non-existent file raises ModelNotFoundError."""
         with pytest.raises(ModelNotFoundError):
@@ -70,12 +122,10 @@ class TestTrainedModelSaveLoad:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_save_load_regression(self, small_regression_data, regression_config, temp_dir):
+    @pytest.mark.xdist_group("trained_reg")
+    def test_save_load_regression(self, regression_bundle, temp_dir):
         """Can save and load regression model."""
-        pipeline = Pipeline.builder().config(regression_config).build()
-        result = pipeline.train(small_regression_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = regression_bundle.trained_model
         model_path = temp_dir / "regression_model.pkl"
         trained_model.save(model_path)
 
@@ -89,45 +139,21 @@ class TestTrainedModelPredict:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_single(self, small_classification_data, classification_config, temp_dir):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_predict_single(self, first_sample_dict, trained_classification_bundle, temp_dir):
         """Can make single prediction."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+        trained_model = trained_classification_bundle.trained_model
 
-        trained_model = pipeline.create_trained_model(result)
-
-        sample = small_classification_data.drop(columns=["target"]).iloc[0].to_dict()
-        prediction = trained_model.predict(sample)
+        prediction = trained_model.predict(first_sample_dict)
 
         assert "prediction" in prediction
         assert prediction["prediction"] in ["yes", "no"]
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_classification_has_full_probabilities(
-        self, small_classification_data, classification_config, temp_dir
-    ):
-        """Classification prediction includes full probabilities dict."""
-        # Use a model that supports predict_proba
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .target_column("target")
-            .algorithm("logistic_regression")
-            .n_trials(2)
-            .cv_folds(2)
-            .enable_neural_networks(False)
-            .enable_explainability(False)
-            .build()
-        )
-
-        pipeline = Pipeline.builder().config(config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-
-        sample = small_classification_data.drop(columns=["target"]).iloc[0].to_dict()
-        prediction = trained_model.predict(sample)
+    def test_predict_classification_probabilities(self, first_sample_dict, logreg_trained_model):
+        """Classification prediction includes probability and full probabilities dict."""
+        prediction = logreg_trained_model.predict(first_sample_dict)
 
         assert "prediction" in prediction
         assert "probabilities" in prediction
@@ -137,46 +163,15 @@ class TestTrainedModelPredict:
         # Probabilities should sum to ~1
         total_prob = sum(prediction["probabilities"].values())
         assert abs(total_prob - 1.0) < 0.01
-
-    @pytest.mark.slow
-    @pytest.mark.integration
-    def test_predict_classification_has_probability(
-        self, small_classification_data, classification_config, temp_dir
-    ):
-        """Classification prediction includes probability (for supported models)."""
-        # Use a model that supports predict_proba
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .target_column("target")
-            .algorithm("logistic_regression")
-            .n_trials(2)
-            .cv_folds(2)
-            .enable_neural_networks(False)
-            .enable_explainability(False)
-            .build()
-        )
-
-        pipeline = Pipeline.builder().config(config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-
-        sample = small_classification_data.drop(columns=["target"]).iloc[0].to_dict()
-        prediction = trained_model.predict(sample)
-
-        assert "prediction" in prediction
         if "probability" in prediction:
             assert 0 <= prediction["probability"] <= 1
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_regression(self, small_regression_data, regression_config, temp_dir):
+    @pytest.mark.xdist_group("trained_reg")
+    def test_predict_regression(self, small_regression_data, regression_bundle, temp_dir):
         """Can make regression prediction."""
-        pipeline = Pipeline.builder().config(regression_config).build()
-        result = pipeline.train(small_regression_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = regression_bundle.trained_model
 
         sample = small_regression_data.drop(columns=["target"]).iloc[0].to_dict()
         prediction = trained_model.predict(sample)
@@ -186,12 +181,24 @@ class TestTrainedModelPredict:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_missing_feature_raises(self, small_classification_data, classification_config):
-        """Missing features in input raises InferenceError."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+    @pytest.mark.xdist_group("trained_clf")
+    def test_predict_matches_predict_batch(
+        self, first_sample_dict, features_head1, trained_classification_bundle
+    ):
+        """Single-instance prediction agrees with batch prediction on the same row."""
+        trained_model = trained_classification_bundle.trained_model
+
+        prediction = trained_model.predict(first_sample_dict)
+        batch = trained_model.predict_batch(features_head1)
+
+        assert prediction["prediction"] == batch["prediction"].iloc[0]
 
-        trained_model = pipeline.create_trained_model(result)
+    @pytest.mark.slow
+    @pytest.mark.integration
+    @pytest.mark.xdist_group("trained_clf")
+    def test_predict_missing_feature_raises(self, trained_classification_bundle):
+        """Missing features in input raises InferenceError."""
+        trained_model = trained_classification_bundle.trained_model
 
         # Missing 'x2' feature
         sample = {"x1": 0.5}
@@ -205,18 +212,15 @@ class TestTrainedModelBatchPredict:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_batch_dataframe(self, small_classification_data, classification_config):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_predict_batch_dataframe(self, features_head5, trained_classification_bundle):
         """Can make batch predictions from DataFrame."""
         import pandas as pd
 
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = trained_classification_bundle.trained_model
 
         # Use first 5 rows for prediction
-        test_data = small_classification_data.drop(columns=["target"]).head(5)
-        predictions = trained_model.predict_batch(test_data)
+        predictions = trained_model.predict_batch(features_head5)
 
         assert isinstance(predictions, pd.DataFrame)
         assert "prediction" in predictions.columns
@@ -224,19 +228,16 @@ class TestTrainedModelBatchPredict:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_predict_batch_csv(self, small_classification_data, classification_config, temp_dir):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_predict_batch_csv(self, features_head5, trained_classification_bundle, temp_dir):
         """Can make batch predictions from CSV file."""
         import pandas as pd
 
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = trained_classification_bundle.trained_model
 
         # Save test data to CSV
-        test_data = small_classification_data.drop(columns=["target"]).head(5)
         csv_path = temp_dir / "test_data.csv"
-        test_data.to_csv(csv_path, index=False)
+        features_head5.to_csv(csv_path, index=False)
 
         predictions = trained_model.predict_batch(csv_path)
 
@@ -246,17 +247,35 @@ class TestTrainedModelBatchPredict:
 
     @pytest.mark.slow
     @pytest.mark.integration
+    @pytest.mark.xdist_group("trained_clf")
+    @pytest.mark.parametrize("suffix", [".feather", ".parquet"])
+    def test_predict_batch_columnar_file(
+        self, features_head5, trained_classification_bundle, temp_dir, suffix
+    ):
+        """Can make batch predictions from Feather and Parquet files."""
+        trained_model = trained_classification_bundle.trained_model
+
+        path = temp_dir / f"test_data{suffix}"
+        if suffix == ".feather":
+            features_head5.to_feather(path)
+        else:
+            features_head5.to_parquet(path)
+
+        predictions = trained_model.predict_batch(path)
+
+        assert "prediction" in predictions.columns
+        assert len(predictions) == 5
+
+    @pytest.mark.slow
+    @pytest.mark.integration
+    @pytest.mark.xdist_group("trained_clf")
     def test_predict_batch_preserves_original_columns(
-        self, small_classification_data, classification_config
+        self, features_head5, trained_classification_bundle
     ):
         """Batch prediction preserves original columns."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+        trained_model = trained_classification_bundle.trained_model
 
-        trained_model = pipeline.create_trained_model(result)
-
-        test_data = small_classification_data.drop(columns=["target"]).head(5)
-        predictions = trained_model.predict_batch(test_data)
+        predictions = trained_model.predict_batch(features_head5)
 
         # Should have original columns plus prediction
         assert "x1" in predictions.columns
@@ -269,82 +288,59 @@ class TestTrainedModelInfo:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_get_info(self, small_classification_data, classification_config):
-        """Can get model info dictionary."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-        info = trained_model.get_info()
+    @pytest.mark.xdist_group("trained_clf")
+    @pytest.mark.parametrize(
+        "key",
+        [
+            "version",
+            "problem_type",
+            "target_column",
+            "best_model_name",
+            "feature_names",
+            "trained_at",
+            "training_time_seconds",
+            "metrics",
+            "hyperparameters",
+        ],
+    )
+    def test_get_info_has_key(self, trained_classification_bundle, key):
+        """Model info dictionary includes each expected key."""
+        info = trained_classification_bundle.trained_model.get_info()
 
         assert isinstance(info, dict)
-        assert "version" in info
-        assert "problem_type" in info
-        assert "target_column" in info
-        assert "best_model_name" in info
-        assert "feature_names" in info
-        assert "trained_at" in info
-        assert "training_time_seconds" in info
-        assert "metrics" in info
-        assert "hyperparameters" in info
-
-    @pytest.mark.slow
-    @pytest.mark.integration
-    def test_get_info_has_hyperparameters(self, small_classification_data, classification_config):
-        """Model info includes hyperparameters dict."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
-        info = trained_model.get_info()
-
-        # hyperparameters should be a dict (or None for simple models)
-        assert "hyperparameters" in info
-        if info["hyperparameters"] is not None:
-            assert isinstance(info["hyperparameters"], dict)
+        assert key in info
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_hyperparameters_property(self, small_classification_data, classification_config):
-        """Model has hyperparameters property."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
+    @pytest.mark.xdist_group("trained_clf")
+    def test_hyperparameters_are_dict_or_none(self, trained_classification_bundle):
+        """Hyperparameters in info and on the property are a dict (or None for simple models)."""
+        trained_model = trained_classification_bundle.trained_model
 
-        # hyperparameters should be a dict or None
-        hyperparams = trained_model.hyperparameters
-        if hyperparams is not None:
-            assert isinstance(hyperparams, dict)
+        for hyperparams in (
+            trained_model.get_info()["hyperparameters"],
+            trained_model.hyperparameters,
+        ):
+            assert hyperparams is None or isinstance(hyperparams, dict)
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_get_info_classification_metrics(
-        self, small_classification_data, classification_config
-    ):
+    @pytest.mark.xdist_group("trained_clf")
+    @pytest.mark.parametrize(
+        "metric", ["accuracy", "precision", "recall", "f1_score", "test_score", "cv_score"]
+    )
+    def test_get_info_classification_metrics(self, trained_classification_bundle, metric):
         """Classification model info includes classification metrics."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+        info = trained_classification_bundle.trained_model.get_info()
 
-        trained_model = pipeline.create_trained_model(result)
-        info = trained_model.get_info()
-
-        metrics = info["metrics"]
-        assert "accuracy" in metrics
-        assert "precision" in metrics
-        assert "recall" in metrics
-        assert "f1_score" in metrics
-        assert "test_score" in metrics
-        assert "cv_score" in metrics
+        assert metric in info["metrics"]
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_get_info_regression_metrics(self, small_regression_data, regression_config):
+    @pytest.mark.xdist_group("trained_reg")
+    def test_get_info_regression_metrics(self, regression_bundle):
         """Regression model info includes regression metrics."""
-        pipeline = Pipeline.builder().config(regression_config).build()
-        result = pipeline.train(small_regression_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = regression_bundle.trained_model
         info = trained_model.get_info()
 
         metrics = info["metrics"]
@@ -355,12 +351,10 @@ class TestTrainedModelInfo:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_properties(self, small_classification_data, classification_config):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_properties(self, trained_classification_bundle):
         """Model properties work correctly."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = trained_classification_bundle.trained_model
 
         assert trained_model.problem_type == ProblemType.CLASSIFICATION
         assert trained_model.target_column == "target"
@@ -370,26 +364,19 @@ class TestTrainedModelInfo:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_class_labels_for_classification(
-        self, small_classification_data, classification_config
-    ):
+    @pytest.mark.xdist_group("trained_clf")
+    def test_class_labels_for_classification(self, trained_classification_bundle):
         """Classification models have class labels."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+        trained_model = trained_classification_bundle.trained_model
 
-        trained_model = pipeline.create_trained_model(result)
-
-        labels = trained_model.class_labels
-        assert labels is not None
-        assert set(labels) == {"yes", "no"}
+        assert trained_model.class_labels is not None
+        assert trained_model.class_labels_set == frozenset({"yes", "no"})
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_class_labels_none_for_regression(self, small_regression_data, regression_config):
+    @pytest.mark.xdist_group("trained_reg")
+    def test_class_labels_none_for_regression(self, regression_bundle):
         """Regression models have None for class labels."""
-        pipeline = Pipeline.builder().config(regression_config).build()
-        result = pipeline.train(small_regression_data)
-
-        trained_model = pipeline.create_trained_model(result)
+        trained_model = regression_bundle.trained_model
 
         assert trained_model.class_labels is None
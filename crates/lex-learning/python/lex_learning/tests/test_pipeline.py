@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from src import (
@@ -55,14 +56,14 @@ class TestPipelineValidation:
         """Pipeline rejects data with null values."""
         import pandas as pd
 
-        data = pd.DataFrame(
-            {"a": [1, 2, None, 4], "b": [5, 6, 7, 8], "target": [0, 1, 0, 1]}  # Null value
-        )
+        values = np.array([[1, 5, 0], [2, 6, 1], [3, 7, 0], [4, 8, 1]], dtype=np.float64)
+        values[2, 0] = np.nan  # Null value
+        data = pd.DataFrame(values, columns=["a", "b", "target"])
 
         pipeline = Pipeline.builder().config(classification_config).build()
 
         with pytest.raises(InvalidDataError):
-            pipeline.train(data)
+            pipeline.validate(data)
 
     def test_validates_target_exists(self):
         """Pipeline rejects data when target column not found."""
@@ -75,12 +76,13 @@ class TestPipelineValidation:
             .build()
         )
 
-        data = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6], "target": [0, 1, 0]})
+        values = np.array([[1, 4, 0], [2, 5, 1], [3, 6, 0]], dtype=np.float64)
+        data = pd.DataFrame(values, columns=["a", "b", "target"])
 
         pipeline = Pipeline.builder().config(config).build()
 
         with pytest.raises(TargetNotFoundError):
-            pipeline.train(data)
+            pipeline.validate(data)
 
     def test_validates_minimum_samples(self, classification_config):
         """Pipeline rejects data with too few samples."""
@@ -91,6 +93,26 @@ class TestPipelineValidation:
 
         pipeline = Pipeline.builder().config(classification_config).build()
 
+        with pytest.raises(InvalidDataError):
+            pipeline.validate(data)
+
+    def test_validates_missing_data(self, classification_config):
+        """validate() and train() both reject missing data with the same error."""
+        pipeline = Pipeline.builder().config(classification_config).build()
+
+        with pytest.raises(InvalidDataError, match="No data provided"):
+            pipeline.validate(None)
+        with pytest.raises(InvalidDataError, match="No data provided"):
+            pipeline.train(None)
+
+    def test_train_runs_validation(self, classification_config):
+        """train() rejects invalid data before fitting anything."""
+        import pandas as pd
+
+        data = pd.DataFrame({"a": [1, 2, 3, 4, 5], "target": [0, 1, 0, 1, 0]})
+
+        pipeline = Pipeline.builder().config(classification_config).build()
+
         with pytest.raises(InvalidDataError):
             pipeline.train(data)
 
@@ -190,60 +212,65 @@ class TestPipelineProgress:
     @pytest.mark.integration
     def test_progress_callback_called(self, small_classification_data, classification_config):
         """Progress callback is called during training."""
-        updates = []
+        stages: set[TrainingStage] = set()
 
         def callback(update: ProgressUpdate) -> None:
-            updates.append(update)
+            stages.add(update.stage)
 
         pipeline = Pipeline.builder().config(classification_config).on_progress(callback).build()
 
         pipeline.train(small_classification_data)
 
-        assert len(updates) > 0
         # Should have at least initializing and complete
-        stages = [u.stage for u in updates]
-        assert TrainingStage.INITIALIZING in stages
-        assert TrainingStage.COMPLETE in stages
+        assert {TrainingStage.INITIALIZING, TrainingStage.COMPLETE} <= stages
 
     @pytest.mark.slow
     @pytest.mark.integration
     def test_progress_increases(self, small_classification_data, classification_config):
         """Progress generally increases during training."""
-        progresses = []
+        # Running counts instead of the full progress history
+        state = {"last": None, "steps": 0, "non_decreasing": 0}
 
         def callback(update: ProgressUpdate) -> None:
-            progresses.append(update.progress)
+            if state["last"] is not None:
+                state["steps"] += 1
+                state["non_decreasing"] += update.progress >= state["last"]
+            state["last"] = update.progress
 
         pipeline = Pipeline.builder().config(classification_config).on_progress(callback).build()
 
         pipeline.train(small_classification_data)
 
         # Progress should reach 1.0 at the end
-        assert progresses[-1] == 1.0
-        # Most progress values should be increasing
-        increasing_count = sum(
-            1 for i in range(1, len(progresses)) if progresses[i] >= progresses[i - 1]
-        )
-        assert increasing_count > len(progresses) * 0.8  # 80% should be increasing
+        assert state["last"] == 1.0
+        # Most progress steps should be non-decreasing
+        assert state["non_decreasing"] > state["steps"] * 0.8
 
     @pytest.mark.slow
     @pytest.mark.integration
     def test_progress_update_fields(self, small_classification_data, classification_config):
         """Progress updates have expected fields."""
-        updates = []
+        # Check each update as it arrives, keeping only the malformed ones
+        seen = 0
+        malformed: list[ProgressUpdate] = []
 
         def callback(update: ProgressUpdate) -> None:
-            updates.append(update)
+            nonlocal seen
+            seen += 1
+            if not (
+                isinstance(update.stage, TrainingStage)
+                and isinstance(update.progress, float)
+                and 0 <= update.progress <= 1
+                and isinstance(update.message, str)
+            ):
+                malformed.append(update)
 
         pipeline = Pipeline.builder().config(classification_config).on_progress(callback).build()
 
         pipeline.train(small_classification_data)
 
-        for update in updates:
-            assert isinstance(update.stage, TrainingStage)
-            assert isinstance(update.progress, float)
-            assert 0 <= update.progress <= 1
-            assert isinstance(update.message, str)
+        assert seen > 0
+        assert malformed == []
 
 
 class TestPipelineModelComparison:
@@ -251,56 +278,14 @@ class TestPipelineModelComparison:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_model_comparison_populated(self, small_classification_data):
-        """Model comparison contains trained models."""
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .target_column("target")
-            .top_k_algorithms(2)
-            .n_trials(2)
-            .cv_folds(2)
-            .enable_neural_networks(False)
-            .enable_explainability(False)
-            .build()
-        )
-
-        pipeline = Pipeline.builder().config(config).build()
-        result = pipeline.train(small_classification_data)
-
-        assert len(result.model_comparison) >= 1
-
-    @pytest.mark.slow
-    @pytest.mark.integration
-    def test_model_comparison_sorted(self, small_classification_data):
-        """Model comparison is sorted by test score descending."""
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .target_column("target")
-            .top_k_algorithms(2)
-            .n_trials(2)
-            .cv_folds(2)
-            .enable_neural_networks(False)
-            .enable_explainability(False)
-            .build()
-        )
-
-        pipeline = Pipeline.builder().config(config).build()
-        result = pipeline.train(small_classification_data)
-
-        if len(result.model_comparison) > 1:
-            scores = [m.test_score for m in result.model_comparison]
-            assert scores == sorted(scores, reverse=True)
-
-    @pytest.mark.slow
-    @pytest.mark.integration
-    def test_best_model_is_first(self, small_classification_data, classification_config):
-        """Best model name matches first in comparison."""
-        pipeline = Pipeline.builder().config(classification_config).build()
-        result = pipeline.train(small_classification_data)
+    def test_model_comparison(self, topk2_result):
+        """Model comparison is populated, sorted by test score, and led by the best model."""
+        comparison = topk2_result.model_comparison
 
-        assert result.best_model_name == result.model_comparison[0].name
+        assert len(comparison) >= 1
+        scores = [m.test_score for m in comparison]
+        assert scores == sorted(scores, reverse=True)
+        assert topk2_result.best_model_name == comparison[0].name
 
 
 class TestPipelineCreateTrainedModel:
@@ -322,15 +307,15 @@ class TestPipelineCreateTrainedModel:
 
     @pytest.mark.slow
     @pytest.mark.integration
-    def test_created_model_can_predict(self, small_classification_data, classification_config):
+    def test_created_model_can_predict(
+        self, small_classification_data, first_sample_dict, classification_config
+    ):
         """Created TrainedModel can make predictions."""
         pipeline = Pipeline.builder().config(classification_config).build()
         result = pipeline.train(small_classification_data)
 
         trained_model = pipeline.create_trained_model(result)
 
-        # Get a sample for prediction
-        sample = small_classification_data.drop(columns=["target"]).iloc[0].to_dict()
-        prediction = trained_model.predict(sample)
+        prediction = trained_model.predict(first_sample_dict)
 
         assert "prediction" in prediction
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from src import ProblemType
 from src.preprocessing import Preprocessor
+from src.preprocessing.onehot import OneHotBlock
 
 
 class TestPreprocessorInit:
@@ -63,16 +66,16 @@ class TestPreprocessorNumeric:
         # Mean should be approximately 0 for each feature
         assert np.abs(X_transformed.mean(axis=0)).max() < 1e-10
 
-    def test_fit_transform_returns_correct_shapes(self):
+    def test_fit_transform_returns_correct_shapes(self, tiny_numeric_xy):
         """fit_transform returns arrays with correct shapes."""
-        X = pd.DataFrame({"a": np.random.randn(100), "b": np.random.randn(100)})
-        y = pd.Series(np.random.randint(0, 2, 100))
+        X, y = tiny_numeric_xy
+        n = len(X)
 
         prep = Preprocessor(ProblemType.CLASSIFICATION)
         X_transformed, y_transformed = prep.fit_transform(X, y)
 
-        assert X_transformed.shape == (100, 2)
-        assert y_transformed.shape == (100,)
+        assert X_transformed.shape == (n, 2)
+        assert y_transformed.shape == (n,)
 
 
 class TestPreprocessorCategorical:
@@ -105,51 +108,94 @@ class TestPreprocessorCategorical:
         assert X_transformed[2].sum() == 1.0
         assert X_transformed[3].sum() == 1.0
 
+    def test_missing_values_are_own_category(self):
+        """None and NaN become trailing categories, matching OneHotEncoder."""
+        from sklearn.preprocessing import OneHotEncoder
+
+        X = pd.DataFrame({"cat": pd.Series(["B", None, "A", np.nan, "A"], dtype=object)})
+        y = pd.Series([0, 1, 0, 1, 0])
+
+        prep = Preprocessor(ProblemType.CLASSIFICATION)
+        X_transformed, _ = prep.fit_transform(X, y)
+        encoder = OneHotEncoder(handle_unknown="ignore", sparse_output=False).fit(X)
+
+        assert prep.transformed_feature_names == [
+            f"categorical__{name}" for name in encoder.get_feature_names_out()
+        ]
+        assert np.array_equal(X_transformed, encoder.transform(X))
+
+        X_new = pd.DataFrame({"cat": pd.Series([np.nan, None, "C"], dtype=object)})
+        assert np.array_equal(prep.transform(X_new)[0], encoder.transform(X_new))
+
 
 class TestPreprocessorMixed:
     """Tests for preprocessing mixed numeric and categorical features."""
 
-    def test_fit_mixed_types(self, mixed_types_data):
+    def test_fit_mixed_types(self, fitted_mixed_prep):
         """Can fit on mixed numeric and categorical data."""
-        X = mixed_types_data.drop(columns=["target"])
-        y = mixed_types_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        prep.fit(X, y)
+        prep = fitted_mixed_prep.preprocessor
 
         assert prep.is_fitted is True
         assert "numeric_1" in prep.feature_names
         assert "category_1" in prep.feature_names
 
-    def test_transform_mixed_types(self, mixed_types_data):
+    def test_transform_mixed_types(self, fitted_mixed_prep):
         """Mixed data is transformed correctly."""
-        X = mixed_types_data.drop(columns=["target"])
-        y = mixed_types_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
+        X_transformed = fitted_mixed_prep.X_transformed
 
         # Should have: 2 numeric + one-hot encoded categoricals
         # category_1 has 3 values (A, B, C) -> 3 columns
         # category_2 has 2 values (X, Y) -> 2 columns
         # Total: 2 + 3 + 2 = 7 columns
-        assert X_transformed.shape[0] == len(X)
+        assert X_transformed.shape[0] == len(fitted_mixed_prep.X)
         assert X_transformed.shape[1] == 7
 
-    def test_transformed_feature_names(self, mixed_types_data):
-        """transformed_feature_names includes one-hot encoded names."""
-        X = mixed_types_data.drop(columns=["target"])
-        y = mixed_types_data["target"]
+    def test_transform_instance_matches_transform(self, fitted_mixed_prep):
+        """Transforming a dict row matches transforming the same DataFrame row."""
+        prep, X_transformed, _, X, _ = fitted_mixed_prep
 
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        prep.fit(X, y)
+        row = prep.transform_instance(X.iloc[3].to_dict())
 
-        names = prep.transformed_feature_names
+        np.testing.assert_allclose(row, X_transformed[3:4])
+
+    def test_transformed_feature_names(self, fitted_mixed_prep):
+        """transformed_feature_names includes one-hot encoded names."""
+        names = fitted_mixed_prep.preprocessor.transformed_feature_names
         assert len(names) == 7
         # Should include original numeric names
         assert any("numeric" in n for n in names)
 
 
+class TestPreprocessorLegacyPickle:
+    """Tests for unpickling preprocessors saved in the ColumnTransformer layout."""
+
+    def test_legacy_pickle_transforms_like_column_transformer(
+        self, legacy_mixed_prep, mixed_types_data
+    ):
+        """A legacy pickle migrates to the same transform and feature names."""
+        X = mixed_types_data.drop(columns=["target"])
+        feature_transformer = legacy_mixed_prep.__dict__["_feature_transformer"]
+
+        prep = pickle.loads(pickle.dumps(legacy_mixed_prep))
+        X_transformed, _ = prep.transform(X)
+
+        assert not hasattr(prep, "_feature_transformer")
+        np.testing.assert_allclose(X_transformed, feature_transformer.transform(X))
+        np.testing.assert_allclose(prep.transform_instance(X.iloc[0].to_dict()), X_transformed[:1])
+        assert prep.transformed_feature_names == list(feature_transformer.get_feature_names_out())
+
+
+class TestOneHotBlock:
+    """Tests for the compact one-hot categorical block."""
+
+    def test_unknown_category_is_zero_group(self):
+        """Unknown codes (-1) expand to an all-zero group."""
+        block = OneHotBlock(np.array([[0, 1], [-1, 0]], dtype=np.int32), [2, 2])
+
+        expected = np.array([[1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 0.0]])
+        assert np.array_equal(block.to_dense(), expected)
+
+
 class TestPreprocessorTarget:
     """Tests for target encoding/decoding."""
 
@@ -194,10 +240,8 @@ class TestPreprocessorTarget:
         y = pd.Series(["A", "B", "C", "A"])
 
         prep = Preprocessor(ProblemType.CLASSIFICATION)
-        prep.fit(X, y)
-
         # Encode then decode
-        _, y_encoded = prep.transform(X, y)
+        _, y_encoded = prep.fit_transform(X, y)
         y_decoded = prep.inverse_transform_target(y_encoded)
 
         # Should get back original labels
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import optuna
 import pytest
 
 from src import ModelResult, PipelineConfig, ProblemType
+from src.errors import CancelledError
+from src.preprocessing import Preprocessor
+from src.progress import CallbackProgressReporter
+from src.training.optimizer import optimize_hyperparameters, split_n_jobs
 from src.training.selector import DatasetInfo, select_algorithms
 from src.training.trainer import train_models, train_single_model
 
@@ -98,7 +103,8 @@ class TestAlgorithmSelection:
         assert len(algorithms) == 3
         assert all(isinstance(alg, str) for alg in algorithms)
 
-    def test_top_k_limit(self):
+    @pytest.mark.parametrize("k", [1, 2, 5])
+    def test_top_k_limit(self, k):
         """Respects top_k limit."""
         dataset_info = DatasetInfo(
             n_samples=1000,
@@ -116,14 +122,13 @@ class TestAlgorithmSelection:
             "lightgbm",
         ]
 
-        for k in [1, 2, 5]:
-            algorithms = select_algorithms(
-                dataset_info=dataset_info,
-                available_algorithms=available,
-                top_k=k,
-                include_neural=False,
-            )
-            assert len(algorithms) == min(k, len(available))
+        algorithms = select_algorithms(
+            dataset_info=dataset_info,
+            available_algorithms=available,
+            top_k=k,
+            include_neural=False,
+        )
+        assert len(algorithms) == min(k, len(available))
 
     def test_include_neural_networks(self):
         """Can include neural networks in selection."""
@@ -180,59 +185,35 @@ class TestAlgorithmSelection:
 class TestDatasetInfo:
     """Tests for DatasetInfo dataclass."""
 
-    def test_size_category_small(self):
-        """Small datasets are categorized correctly."""
+    @pytest.mark.parametrize(
+        ("n_samples", "expected"), [(500, "small"), (5000, "medium"), (50000, "large")]
+    )
+    def test_size_category(self, n_samples, expected):
+        """Datasets are categorized by sample count."""
         info = DatasetInfo(
-            n_samples=500,
+            n_samples=n_samples,
             n_features=10,
             problem_type=ProblemType.CLASSIFICATION,
         )
-        assert info.size_category == "small"
-
-    def test_size_category_medium(self):
-        """Medium datasets are categorized correctly."""
+        assert info.size_category == expected
+
+    @pytest.mark.parametrize(
+        ("n_samples", "n_features", "expected"),
+        [
+            (1000, 150, True),  # > 100 features
+            (100, 60, True),  # > 50% of samples
+            (1000, 20, False),
+        ],
+        ids=["by_count", "by_ratio", "normal"],
+    )
+    def test_high_dimensional(self, n_samples, n_features, expected):
+        """High dimensionality is detected by feature count or feature ratio."""
         info = DatasetInfo(
-            n_samples=5000,
-            n_features=10,
+            n_samples=n_samples,
+            n_features=n_features,
             problem_type=ProblemType.CLASSIFICATION,
         )
-        assert info.size_category == "medium"
-
-    def test_size_category_large(self):
-        """Large datasets are categorized correctly."""
-        info = DatasetInfo(
-            n_samples=50000,
-            n_features=10,
-            problem_type=ProblemType.CLASSIFICATION,
-        )
-        assert info.size_category == "large"
-
-    def test_high_dimensional_by_count(self):
-        """High feature count is detected."""
-        info = DatasetInfo(
-            n_samples=1000,
-            n_features=150,  # > 100
-            problem_type=ProblemType.CLASSIFICATION,
-        )
-        assert info.is_high_dimensional is True
-
-    def test_high_dimensional_by_ratio(self):
-        """High feature ratio is detected."""
-        info = DatasetInfo(
-            n_samples=100,
-            n_features=60,  # > 50% of samples
-            problem_type=ProblemType.CLASSIFICATION,
-        )
-        assert info.is_high_dimensional is True
-
-    def test_not_high_dimensional(self):
-        """Normal dimensionality is detected."""
-        info = DatasetInfo(
-            n_samples=1000,
-            n_features=20,
-            problem_type=ProblemType.CLASSIFICATION,
-        )
-        assert info.is_high_dimensional is False
+        assert info.is_high_dimensional is expected
 
 
 class TestModelResult:
@@ -277,32 +258,11 @@ class TestTrainSingleModel:
     """Tests for train_single_model function."""
 
     @pytest.mark.slow
-    def test_train_single_model(self, small_classification_data):
+    def test_train_single_model(
+        self, preprocessed_small_classification, default_classification_config
+    ):
         """Can train a single model."""
-        from sklearn.model_selection import train_test_split
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_transformed, y_transformed, test_size=0.2, random_state=42
-        )
-
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .algorithm("decision_tree")
-            .n_trials(2)
-            .cv_folds(2)
-            .optimize_hyperparams(False)
-            .build()
-        )
+        X_train, X_test, y_train, y_test, _ = preprocessed_small_classification
 
         result = train_single_model(
             X_train=X_train,
@@ -310,7 +270,7 @@ class TestTrainSingleModel:
             X_test=X_test,
             y_test=y_test,
             algorithm="decision_tree",
-            config=config,
+            config=default_classification_config,
         )
 
         assert result is not None
@@ -325,164 +285,117 @@ class TestTrainModels:
     """Tests for train_models function."""
 
     @pytest.mark.slow
-    def test_train_multiple_models(self, small_classification_data):
-        """Can train multiple models."""
-        from sklearn.model_selection import train_test_split
-
-        from src.preprocessing import Preprocessor
-
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_transformed, y_transformed, test_size=0.2, random_state=42
-        )
-
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .n_trials(2)
-            .cv_folds(2)
-            .optimize_hyperparams(False)
-            .build()
-        )
+    def test_train_models_contract(
+        self, preprocessed_small_classification, default_classification_config
+    ):
+        """Trains every algorithm once, sorted by test score with the best first."""
+        X_train, X_test, y_train, y_test, _ = preprocessed_small_classification
+        algorithms = ["decision_tree", "logistic_regression"]
 
         best_model, results = train_models(
             X_train=X_train,
             y_train=y_train,
             X_test=X_test,
             y_test=y_test,
-            algorithms=["decision_tree", "logistic_regression"],
-            config=config,
+            algorithms=algorithms,
+            config=default_classification_config,
         )
 
-        assert best_model is not None
-        assert len(results) == 2
-        names = [r.name for r in results]
-        assert "decision_tree" in names
-        assert "logistic_regression" in names
+        assert {r.name for r in results} >= {"decision_tree", "logistic_regression"}
 
-    @pytest.mark.slow
-    def test_results_sorted_by_score(self, small_classification_data):
-        """Results are sorted by test score (descending)."""
-        from sklearn.model_selection import train_test_split
+        # Check sorted descending
+        scores = [r.test_score for r in results]
+        assert scores == sorted(scores, reverse=True)
 
-        from src.preprocessing import Preprocessor
+        # Best model should correspond to first (highest score) result
+        assert best_model is not None
+        assert results[0].name in algorithms
 
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
 
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
+class TestOptunaOptimization:
+    """Tests for Optuna hyperparameter optimization."""
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_transformed, y_transformed, test_size=0.2, random_state=42
-        )
+    @pytest.mark.parametrize(
+        ("algorithm", "expected"),
+        [("random_forest", (4, 1)), ("logistic_regression", (1, 4))],
+        ids=["model_parallel", "fold_parallel"],
+    )
+    def test_split_n_jobs(self, algorithm, expected):
+        """Ensembles keep n_jobs on the model; other algorithms parallelise CV folds."""
+        assert split_n_jobs(algorithm, 4) == expected
 
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .n_trials(2)
-            .cv_folds(2)
-            .optimize_hyperparams(False)
-            .build()
-        )
+    @pytest.mark.slow
+    def test_optimization_produces_hyperparameters(
+        self, preprocessed_small_classification, optuna_classification_config
+    ):
+        """Optimization produces hyperparameter values."""
+        X_train, X_test, y_train, y_test, _ = preprocessed_small_classification
 
-        _, results = train_models(
+        result = train_single_model(
             X_train=X_train,
             y_train=y_train,
             X_test=X_test,
             y_test=y_test,
-            algorithms=["decision_tree", "logistic_regression", "knn"],
-            config=config,
+            algorithm="decision_tree",
+            config=optuna_classification_config,
         )
 
-        # Check sorted descending
-        scores = [r.test_score for r in results]
-        assert scores == sorted(scores, reverse=True)
-
-    @pytest.mark.slow
-    def test_best_model_is_top_scorer(self, small_classification_data):
-        """Best model returned is the top scorer."""
-        from sklearn.model_selection import train_test_split
-
-        from src.preprocessing import Preprocessor
+        assert result is not None
+        _, model_result = result
+        # Optimized model should have hyperparameters
+        assert isinstance(model_result.hyperparameters, dict)
 
+    def test_cancellation_stops_optimization(self, small_classification_data):
+        """Cancellation raised inside a trial is not swallowed by the study."""
         X = small_classification_data.drop(columns=["target"])
         y = small_classification_data["target"]
 
         prep = Preprocessor(ProblemType.CLASSIFICATION)
         X_transformed, y_transformed = prep.fit_transform(X, y)
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_transformed, y_transformed, test_size=0.2, random_state=42
-        )
-
         config = (
             PipelineConfig.builder()
             .problem_type(ProblemType.CLASSIFICATION)
-            .n_trials(2)
+            .algorithm("decision_tree")
+            .n_trials(5)
             .cv_folds(2)
-            .optimize_hyperparams(False)
             .build()
         )
+        reporter = CallbackProgressReporter(cancellation_check=lambda: True)
 
-        best_model, results = train_models(
-            X_train=X_train,
-            y_train=y_train,
-            X_test=X_test,
-            y_test=y_test,
-            algorithms=["decision_tree", "logistic_regression"],
-            config=config,
-        )
+        with pytest.raises(CancelledError):
+            optimize_hyperparameters(
+                X_transformed, y_transformed, "decision_tree", config, reporter
+            )
 
-        # Best model should correspond to first (highest score) result
-        assert results[0].name in ["decision_tree", "logistic_regression"]
+    def test_cancellation_mid_study_stops_remaining_trials(
+        self, preprocessed_small_classification, default_classification_config, monkeypatch
+    ):
+        """Cancelling after a completed trial stops the study and raises CancelledError."""
+        X_train, _, y_train, _, _ = preprocessed_small_classification
+        studies: list[optuna.Study] = []
 
+        def create_study(**kwargs):
+            studies.append(optuna.study.create_study(**kwargs))
+            return studies[-1]
 
-class TestOptunaOptimization:
-    """Tests for Optuna hyperparameter optimization."""
+        monkeypatch.setattr(optuna, "create_study", create_study)
 
-    @pytest.mark.slow
-    def test_optimization_produces_hyperparameters(self, small_classification_data):
-        """Optimization produces hyperparameter values."""
-        from sklearn.model_selection import train_test_split
+        # First check (before trial 0) passes; the callback after trial 0 sees the cancel
+        n_checks = 0
 
-        from src.preprocessing import Preprocessor
+        def cancel_after_first_check() -> bool:
+            nonlocal n_checks
+            n_checks += 1
+            return n_checks > 1
 
-        X = small_classification_data.drop(columns=["target"])
-        y = small_classification_data["target"]
-
-        prep = Preprocessor(ProblemType.CLASSIFICATION)
-        X_transformed, y_transformed = prep.fit_transform(X, y)
-
-        X_train, X_test, y_train, y_test = train_test_split(
-            X_transformed, y_transformed, test_size=0.2, random_state=42
-        )
-
-        config = (
-            PipelineConfig.builder()
-            .problem_type(ProblemType.CLASSIFICATION)
-            .algorithm("decision_tree")
-            .optimize_hyperparams(True)
-            .n_trials(3)
-            .cv_folds(2)
-            .build()
-        )
+        reporter = CallbackProgressReporter(cancellation_check=cancel_after_first_check)
 
-        result = train_single_model(
-            X_train=X_train,
-            y_train=y_train,
-            X_test=X_test,
-            y_test=y_test,
-            algorithm="decision_tree",
-            config=config,
-        )
+        # default_classification_config allows two trials; only the first may run
+        with pytest.raises(CancelledError):
+            optimize_hyperparameters(
+                X_train, y_train, "decision_tree", default_classification_config, reporter
+            )
 
-        assert result is not None
-        _, model_result = result
-        # Optimized model should have hyperparameters
-        assert isinstance(model_result.hyperparameters, dict)
+        assert len(studies[0].trials) == 1
+        assert studies[0].trials[0].state == optuna.trial.TrialState.COMPLETE